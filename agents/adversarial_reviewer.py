@@ -15,18 +15,23 @@ critique alongside the deliverable.
 
 import json
 import os
-from crewai import Agent
-from config.settings import LLMConfig
+from functools import lru_cache
+from pathlib import Path
 
-from tools.advanced_research import WebFetchTool, DeepResearchTool
-from tools.custom_tools import RegulatoryRAGTool, SlotDatabaseSearchTool
+# crewai, LLM routing and the tool registry are imported inside the agent
+# factories: the prompt builders below are all the pipeline needs when
+# adversarial review is off, and they shouldn't pay for crewai/litellm.
 
 
-def create_adversarial_reviewer() -> Agent:
+def create_adversarial_reviewer() -> "Agent":
     """
     The Devil's Advocate. Uses GPT-4o (heavy) because this agent
     needs maximum reasoning depth to find genuine flaws.
     """
+    from crewai import Agent
+    from config.settings import LLMConfig, PipelineConfig
+    from tools.registry import get_tool
+
     return Agent(
         role="Adversarial Reviewer & Red Team Analyst",
         goal=(
@@ -45,134 +50,76 @@ def create_adversarial_reviewer() -> Agent:
         ),
         llm=LLMConfig.get_llm("lead_producer"),  # Uses GPT-4o for deep reasoning
         max_iter=5,
-        verbose=True,
+        verbose=PipelineConfig.REVIEW_VERBOSE,
         tools=[
-            WebFetchTool(),
-            DeepResearchTool(),
-            RegulatoryRAGTool(),
-            SlotDatabaseSearchTool(),
+            get_tool("web_fetch"),
+            get_tool("deep_research"),
+            get_tool("reg_rag"),
+            get_tool("slot_search"),
         ],
     )
 
 
-# ============================================================
-# Review Prompts for Each Pipeline Stage
-# ============================================================
-
-REVIEW_PROMPTS = {
-    "post_research": """
-ADVERSARIAL REVIEW: Market Research
-
-You are reviewing the market research output. Your job is to identify:
-
-1. **Confirmation Bias**: Did the research only look for evidence supporting the concept?
-   Find counter-evidence. Search for games with this theme that FAILED.
-
-2. **Market Saturation**: How many games already exist with this exact theme?
-   If there are 50+ Egyptian slots, the bar for differentiation is extremely high.
-
-3. **Data Recency**: Is the research using current data? The market shifts fast.
-   Check if cited games are still actively deployed or have been retired.
-
-4. **Missing Competitors**: What major competitors were MISSED? Use the competitor
-   teardown tool to find games the research overlooked.
-
-5. **Audience Assumptions**: Does the research assume a target audience without data?
-   Challenge demographic claims with actual market intelligence.
-
-DELIVERABLE: Write a structured critique with:
-- CRITICAL ISSUES (must fix before proceeding)
-- WARNINGS (should address)
-- SUGGESTIONS (nice to have)
-- MISSING DATA (what wasn't researched)
-""",
-
-    "post_design_math": """
-ADVERSARIAL REVIEW: Game Design Document + Math Model
-
-This is the MOST CRITICAL review point. Scrutinize:
-
-1. **Math Integrity**:
-   - Does the RTP actually hit the target? Verify the simulation methodology.
-   - Is the hit frequency realistic for the claimed volatility?
-   - Does the max win actually occur at the claimed frequency?
-   - Are the reel strips properly balanced? Check for degenerate patterns.
-   - Does the win distribution match the volatility claim?
-
-2. **Feature Feasibility**:
-   - Can every feature described in the GDD be mathematically modeled?
-   - Are trigger rates realistic? (e.g., if bonus triggers 1 in 200 spins,
-     does the base game RTP still work?)
-   - Do feature interactions create exploitable patterns?
 
-3. **Regulatory Compliance**:
-   - Check RTP against EACH target market's requirements.
-   - UK requires 70-99.9% RTP. Malta requires >92%. Ontario varies.
-   - Does the max win exceed any market's limits?
-   - Is the bonus buy feature legal in all target markets? (UK BANNED it)
-
-4. **Design vs Math Alignment**:
-   - Does the GDD describe features the math model doesn't account for?
-   - Are there "creative" features that are mathematically impossible?
-
-5. **Competitive Positioning**:
-   - Search for the exact feature combination proposed. Has it been done?
-   - Is the claimed "differentiation" actually different?
-
-DELIVERABLE: Write a structured critique with specific fixes for each issue.
-If the math doesn't work, provide the exact numbers that are wrong.
-""",
-
-    "post_art_review": """
-ADVERSARIAL REVIEW: Art Direction & Mood Boards
-
-Review the art assets for:
-
-1. **Brand Differentiation**: Does this look like every other slot in the market?
-   Search for existing games with similar themes and compare the visual approach.
+def create_section_reviewer() -> "Agent":
+    """
+    Light red-team agent that drafts ONE section of a critique. Several of
+    these run in parallel and create_adversarial_reviewer() merges their
+    drafts (see PipelineConfig.REVIEW_FANOUT).
+    """
+    from crewai import Agent
+    from config.settings import LLMConfig, PipelineConfig
+    from tools.registry import get_tool
 
-2. **Regulatory Art Compliance**:
-   - No content that could be construed as appealing to minors
-   - No glorification of gambling/addiction
-   - UK ASA guidelines compliance
-   - Symbol distinguishability (critical for accessibility)
+    return Agent(
+        role="Red Team Section Analyst",
+        goal=(
+            "Write one section of an adversarial review. Stay inside your assigned section, "
+            "be specific, and pair every problem with an actionable fix."
+        ),
+        backstory=(
+            "Junior analyst on a former regulator's red team. You take one angle of a review — "
+            "blocking issues, warnings, research gaps or competitors — and cover it thoroughly "
+            "so the lead reviewer can assemble the final verdict."
+        ),
+        llm=LLMConfig.LIGHT,
+        max_iter=3,
+        verbose=PipelineConfig.REVIEW_VERBOSE,
+        tools=[
+            get_tool("web_fetch"),
+            get_tool("reg_rag"),
+            get_tool("slot_search"),
+        ],
+    )
 
-3. **Production Feasibility**:
-   - Can this art style be consistently maintained across 100+ symbols?
-   - Are the proposed animations technically feasible?
-   - Will the color palette work on mobile screens?
 
-4. **Cultural Sensitivity**:
-   - Check for unintentional cultural insensitivity in theme depiction
-   - Religious symbols used inappropriately
-   - Stereotypical representations
+# ============================================================
+# Review Prompts for Each Pipeline Stage
+# ============================================================
 
-5. **Consistency**:
-   - Do all mood board variants actually match the GDD's theme description?
-   - Is there a coherent visual language?
+# Prompt bodies live in prompts/adversarial/{stage}.md and are read on first
+# use, so processes that never run a review don't hold them in memory.
 
-DELIVERABLE: Critique with specific visual references and fixes.
-""",
-}
+REVIEW_STAGES = ("post_research", "post_design_math", "post_art_review")
 
+PROMPTS_DIR = Path(__file__).parent.parent / "prompts" / "adversarial"
 
-def build_review_task_description(stage: str, context_summary: str, output_dir: str) -> str:
-    """Build the full adversarial review task description."""
-    base_prompt = REVIEW_PROMPTS.get(stage, "")
 
-    return f"""
-{base_prompt}
+@lru_cache(maxsize=None)
+def _get_review_prompt(stage: str) -> str:
+    """Load the review prompt for a stage (empty string if there is none)."""
+    prompt_path = PROMPTS_DIR / f"{stage}.md"
+    if prompt_path.exists():
+        return prompt_path.read_text(encoding="utf-8")
+    return ""
 
-=== CONTEXT ===
-{context_summary}
 
-=== OUTPUT DIRECTORY ===
-{output_dir}
+_STAGE_TITLES = {stage: stage.replace("_", " ").title() for stage in REVIEW_STAGES}
 
-=== YOUR CRITIQUE FORMAT ===
+_CRITIQUE_FORMAT = """=== YOUR CRITIQUE FORMAT ===
 Write your review as a structured report:
 
-## ADVERSARIAL REVIEW: {stage.replace('_', ' ').title()}
+## ADVERSARIAL REVIEW: {stage_title}
 
 ### VERDICT: [PASS / PASS WITH CONDITIONS / FAIL]
 
@@ -192,6 +139,100 @@ Write your review as a structured report:
 
 ### RECOMMENDATION
 [1-2 sentences: proceed, proceed with changes, or redo this stage]
-
-Save your review to: {output_dir}/adversarial_review_{stage}.md
 """
+
+# Critique format already rendered for each known stage
+_STAGE_HEADERS = {
+    stage: _CRITIQUE_FORMAT.format(stage_title=title) for stage, title in _STAGE_TITLES.items()
+}
+
+@lru_cache(maxsize=None)
+def _review_prefix(stage: str) -> str:
+    """Everything before the run-specific context: identical for every run of a stage."""
+    critique_format = _STAGE_HEADERS.get(stage)
+    if critique_format is None:
+        critique_format = _CRITIQUE_FORMAT.format(stage_title=stage.replace("_", " ").title())
+    return "".join(("\n", _get_review_prompt(stage), "\n\n", critique_format, "\n"))
+
+
+def _review_context(stage: str, context_summary: str, output_dir: str) -> str:
+    """The run-specific tail of a review description."""
+    return "".join((
+        "=== CONTEXT ===\n", context_summary, "\n\n",
+        "=== OUTPUT DIRECTORY ===\n", output_dir, "\n\n",
+        "Save your review to: ", output_dir, "/adversarial_review_", stage, ".md\n",
+    ))
+
+
+def build_review_task_description(stage: str, context_summary: str, output_dir: str) -> str:
+    """
+    Build the full adversarial review task description.
+
+    The stage prompt and critique format are static per stage, so they go
+    first; the run-specific context and output path are appended last. That
+    keeps an identical prefix across runs for provider-side prompt caching
+    (OpenAI caches matching prefixes automatically).
+    """
+    return _review_prefix(stage) + _review_context(stage, context_summary, output_dir)
+
+
+# ============================================================
+# Section Fan-Out (PipelineConfig.REVIEW_FANOUT)
+#
+# The four body sections of the critique don't depend on each other, so
+# each can be drafted by its own light agent in parallel. The heavy
+# reviewer then only has to merge them and write the verdict.
+# ============================================================
+
+REVIEW_SECTIONS = {
+    "critical_issues": (
+        "CRITICAL ISSUES (Block pipeline until fixed)",
+        "List every issue that must be fixed before the pipeline proceeds, as\n"
+        "1. [Issue] — [Why it matters] — [Specific fix]",
+    ),
+    "warnings": (
+        "WARNINGS (Should fix but not blocking)",
+        "List issues that should be addressed but don't block the pipeline, as\n"
+        "1. [Issue] — [Recommended action]",
+    ),
+    "gaps": (
+        "GAPS IN RESEARCH (What wasn't checked)",
+        "List what the deliverable failed to research or verify, as\n"
+        "1. [Gap] — [Why it matters]",
+    ),
+    "competitive_intel": (
+        "COMPETITIVE INTELLIGENCE",
+        "Search for similar products in market and summarize what you find, "
+        "with game names, providers and the specific overlap.",
+    ),
+}
+
+
+def build_section_task_description(stage: str, section: str, context_summary: str) -> str:
+    """Task for one section analyst: the stage prompt narrowed to a single section."""
+    heading, instructions = REVIEW_SECTIONS[section]
+    return (
+        f"{_get_review_prompt(stage)}\n"
+        f"=== YOUR ASSIGNMENT ===\n"
+        f"Write ONLY the \"{heading}\" section of this review.\n"
+        f"{instructions}\n\n"
+        f"=== CONTEXT ===\n{context_summary}\n"
+    )
+
+
+def build_aggregate_task_description(stage: str, output_dir: str) -> str:
+    """Task for the lead reviewer: merge the section drafts into the final report."""
+    stage_title = _STAGE_TITLES.get(stage) or stage.replace("_", " ").title()
+    section_list = "\n".join(f"### {heading}" for heading, _ in REVIEW_SECTIONS.values())
+    return (
+        f"You have section drafts for the adversarial review of {stage_title} "
+        f"in your context. Merge them into one report: remove duplicates, move any "
+        f"misfiled item to the right section, and challenge anything that looks weak.\n\n"
+        f"Use this structure:\n\n"
+        f"## ADVERSARIAL REVIEW: {stage_title}\n\n"
+        f"### VERDICT: [PASS / PASS WITH CONDITIONS / FAIL]\n\n"
+        f"{section_list}\n\n"
+        f"### RECOMMENDATION\n"
+        f"[1-2 sentences: proceed, proceed with changes, or redo this stage]\n\n"
+        f"Save your review to: {output_dir}/adversarial_review_{stage}.md\n"
+    )
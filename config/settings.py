@@ -10,7 +10,10 @@ PHASE 2: HYBRID LLM WIRING (PRODUCTION)
 """
 
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -77,12 +80,36 @@ class LLMConfig:
     @classmethod
     def get_llm(cls, agent_key: str) -> str:
         """Return the litellm model string for CrewAI's `llm` param."""
-        return cls.AGENTS.get(agent_key, {}).get("model", cls.LIGHT)
+        return _agent_model(agent_key)
 
     @classmethod
     def get_config(cls, agent_key: str) -> dict:
         """Return full config dict for an agent."""
-        return cls.AGENTS.get(agent_key, {"model": cls.LIGHT, "temperature": 0.5, "max_tokens": 16384})
+        return _agent_config(agent_key)
+
+
+# Routing is fixed once the class is built, so per-agent lookups are memoized.
+# lru_cache doesn't sit well on classmethods, hence the module-level helpers.
+
+@lru_cache(maxsize=32)
+def _agent_model(agent_key: str) -> str:
+    return LLMConfig.AGENTS.get(agent_key, {}).get("model", LLMConfig.LIGHT)
+
+
+@lru_cache(maxsize=32)
+def _agent_config(agent_key: str) -> dict:
+    return LLMConfig.AGENTS.get(agent_key, {"model": LLMConfig.LIGHT, "temperature": 0.5, "max_tokens": 16384})
+
+
+# (input, output) USD per 1M tokens for each routed agent
+_COST_RATES_BY_AGENT = {
+    key: (LLMConfig.COST_INPUT.get(cfg["model"], 5.0), LLMConfig.COST_OUTPUT.get(cfg["model"], 15.0))
+    for key, cfg in LLMConfig.AGENTS.items()
+}
+_DEFAULT_COST_RATES = (
+    LLMConfig.COST_INPUT.get(LLMConfig.LIGHT, 5.0),
+    LLMConfig.COST_OUTPUT.get(LLMConfig.LIGHT, 15.0),
+)
 
 
 # ============================================================
@@ -90,42 +117,69 @@ class LLMConfig:
 # ============================================================
 
 class CostTracker:
+    """
+    Token + image spend for a pipeline run.
+
+    Agents running in parallel log into the same tracker, so every update
+    and every read holds one lock. The critical sections are a handful of
+    additions, and readers get copies, so a summary never iterates a dict
+    another thread is inserting into.
+    """
+
     def __init__(self):
-        self.usage = {}
-        self.images = 0
-        self.image_cost = 0.0
+        self._lock = threading.Lock()
+        self._usage: dict[str, dict] = {}
+        self._cost = 0.0  # token spend, accumulated per call at the agent's rates
+        self._images = 0
+        self._image_cost = 0.0
 
     def log(self, agent_key: str, input_tokens: int = 0, output_tokens: int = 0):
-        if agent_key not in self.usage:
-            self.usage[agent_key] = {"input": 0, "output": 0, "calls": 0}
-        self.usage[agent_key]["input"] += input_tokens
-        self.usage[agent_key]["output"] += output_tokens
-        self.usage[agent_key]["calls"] += 1
-        total = self.usage[agent_key]["input"] + self.usage[agent_key]["output"]
+        in_rate, out_rate = _COST_RATES_BY_AGENT.get(agent_key, _DEFAULT_COST_RATES)
+        with self._lock:
+            entry = self._usage.get(agent_key)
+            if entry is None:
+                entry = self._usage[agent_key] = {"input": 0, "output": 0, "calls": 0}
+            entry["input"] += input_tokens
+            entry["output"] += output_tokens
+            entry["calls"] += 1
+            self._cost += (input_tokens * in_rate + output_tokens * out_rate) / 1e6
+            total = entry["input"] + entry["output"]
         budget = LLMConfig.TOKEN_BUDGETS.get(agent_key, float("inf"))
         if total > budget:
             print(f"⚠️  {agent_key} token budget exceeded: {total:,}/{budget:,}")
 
     def log_image(self, size="1024x1024"):
-        self.images += 1
-        self.image_cost += LLMConfig.COST_IMAGE.get(size, 0.04)
+        with self._lock:
+            self._images += 1
+            self._image_cost += LLMConfig.COST_IMAGE.get(size, 0.04)
+
+    @property
+    def usage(self) -> dict:
+        """Per-agent {input, output, calls} (a snapshot)."""
+        with self._lock:
+            return {key: dict(data) for key, data in self._usage.items()}
+
+    @property
+    def images(self) -> int:
+        return self._images
+
+    @property
+    def image_cost(self) -> float:
+        return self._image_cost
 
     def total_tokens(self) -> int:
         return sum(v["input"] + v["output"] for v in self.usage.values())
 
     def total_cost(self) -> float:
-        cost = 0.0
-        for key, data in self.usage.items():
-            model = LLMConfig.get_llm(key)
-            cost += (data["input"] / 1e6) * LLMConfig.COST_INPUT.get(model, 5.0)
-            cost += (data["output"] / 1e6) * LLMConfig.COST_OUTPUT.get(model, 15.0)
-        return round(cost + self.image_cost, 4)
+        with self._lock:
+            return round(self._cost + self._image_cost, 4)
 
     def summary(self) -> dict:
+        usage = self.usage
         return {
             "per_agent": {
                 k: {"model": LLMConfig.get_llm(k), **v, "budget": LLMConfig.TOKEN_BUDGETS.get(k)}
-                for k, v in self.usage.items()
+                for k, v in usage.items()
             },
             "total_tokens": self.total_tokens(),
             "total_images": self.images,
@@ -140,6 +194,25 @@ class CostTracker:
 class PipelineConfig:
     HITL_ENABLED = os.getenv("HITL_ENABLED", "true").lower() == "true"
     HITL_CHECKPOINTS = {"post_research": True, "post_design_math": True, "post_art_review": True}
+    # Checkpoints whose review page never shows files skip the output-dir walk
+    HITL_STAGES_WITHOUT_FILES = frozenset(
+        s.strip() for s in os.getenv("HITL_STAGES_WITHOUT_FILES", "").split(",") if s.strip()
+    )
+    HITL_TIMEOUT_S = int(os.getenv("HITL_TIMEOUT_S", "7200"))
+    # Web HITL polls back off from 0.5s up to this interval
+    HITL_POLL_INTERVAL_S = float(os.getenv("HITL_POLL_INTERVAL_S", "2.0"))
+    # Draft review sections with parallel light agents, merged by the reviewer
+    REVIEW_FANOUT = os.getenv("REVIEW_FANOUT", "false").lower() == "true"
+    # Step-by-step CrewAI logging for adversarial reviews (their critique file is the output)
+    REVIEW_VERBOSE = os.getenv("REVIEW_VERBOSE", "false").lower() == "true"
+    # Step-by-step CrewAI logging for State Recon agents and crews (stage JSON files are the output)
+    RECON_VERBOSE = os.getenv("RECON_VERBOSE", "false").lower() == "true"
+    # Max concurrent Qdrant lookups when pulling per-market recon data
+    RECON_LOOKUP_WORKERS = int(os.getenv("RECON_LOOKUP_WORKERS", "8"))
+    # Max State Recon research passes (one agent each) running at once
+    RECON_PASS_WORKERS = int(os.getenv("RECON_PASS_WORKERS", "3"))
+    # How long an opted-in (--cache) State Recon stage output stays reusable, in hours (0 = never)
+    RECON_CACHE_TTL_H = float(os.getenv("RECON_CACHE_TTL_H", "24"))
     SIMULATION_SPINS = int(os.getenv("SIMULATION_SPINS", "1000000"))
     COMPETITOR_BROAD_SWEEP_LIMIT = 30
     COMPETITOR_DEEP_DIVE_LIMIT = 10
@@ -238,6 +311,21 @@ JURISDICTION_REQUIREMENTS = {
 }
 
 
+def _freeze_jurisdiction(entry: dict) -> MappingProxyType:
+    """Read-only view of one market: certifiers as a frozenset, restrictions as a tuple."""
+    frozen = dict(entry)
+    frozen["certifiers"] = frozenset(entry.get("certifiers", ()))
+    frozen["content_restrictions"] = tuple(entry.get("content_restrictions", ()))
+    return MappingProxyType(frozen)
+
+
+# Frozen at import so every thread can share it without defensive copies,
+# and certifier overlap across markets is a plain set intersection.
+JURISDICTION_REQUIREMENTS = MappingProxyType({
+    market: _freeze_jurisdiction(entry) for market, entry in JURISDICTION_REQUIREMENTS.items()
+})
+
+
 # ============================================================
 # DEPRECATED — Static loophole data removed.
 # All US jurisdiction intelligence now lives in Qdrant,
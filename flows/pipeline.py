@@ -9,54 +9,73 @@ PHASE 2+3 WIRED:
 - Math agent receives simulation template
 """
 
+import asyncio
+import contextvars
+import heapq
 import json
 import os
+import re
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from crewai import Agent, Crew, Process, Task
 from crewai.flow.flow import Flow, listen, start
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
+from rich.text import Text
 
 from config.settings import (
     LLMConfig, PipelineConfig, RAGConfig,
     CostTracker, JURISDICTION_REQUIREMENTS,
 )
-from models.schemas import GameIdeaInput
-from tools.custom_tools import (
-    SlotDatabaseSearchTool,
-    MathSimulationTool,
-    ImageGenerationTool,
-    RegulatoryRAGTool,
-    FileWriterTool,
+from agents.adversarial_reviewer import (
+    REVIEW_SECTIONS, build_aggregate_task_description,
+    build_review_task_description, build_section_task_description,
+    create_adversarial_reviewer, create_section_reviewer,
 )
-from tools.advanced_research import (
-    WebFetchTool,
-    DeepResearchTool,
-    CompetitorTeardownTool,
-    KnowledgeBaseTool,
+from models.schemas import GameIdeaInput
+from tools.tier1_upgrades import JurisdictionIntersectionTool, TrendRadarTool
+from tools.tier2_upgrades import PatentIPScannerTool, HTML5PrototypeTool
+from tools.registry import get_tool, tool_run_cache
+from tools.json_io import dumps_bytes, read_json, write_json
+
+console = Console()
+
+# Same as mapping every non-alphanumeric char to "_" (isalnum ≡ \w minus "_"),
+# in one C-level pass
+_SLUG_RE = re.compile(r"\W")
+
+# Stage directories created under each run's output_dir
+OUTPUT_SUBDIRS = (
+    "00_preflight", "01_research", "02_design", "03_math", "04_art/mood_boards",
+    "04_art/symbols", "04_art/backgrounds", "04_art/ui",
+    "04_audio", "05_legal", "06_pdf", "07_prototype",
 )
-from tools.tier1_upgrades import (
-    VisionQATool,
-    PaytableOptimizerTool,
-    JurisdictionIntersectionTool,
-    PlayerBehaviorModelTool,
-    AgentDebateTool,
-    TrendRadarTool,
+
+# Longest slice of a stage's output that any later prompt or summary uses
+_CONTEXT_CHARS = 5000
+
+# Pre-flight sections of the research prompt (see _preflight_context)
+_JURISDICTION_CTX = (
+    "\nJURISDICTION CONSTRAINTS:\n"
+    "  RTP floor: {rtp_floor}%\n"
+    "  Banned features: {banned}\n"
+    "  Required features: {required}\n"
+    "  Blockers: {blockers}\n"
 )
-from tools.tier2_upgrades import (
-    PatentIPScannerTool,
-    HTML5PrototypeTool,
-    SoundDesignTool,
-    CertificationPlannerTool,
+_PATENT_CTX = (
+    "\nPATENT SCAN:\n"
+    "  Overall IP risk: {risk}\n"
+    "  Known patent hits: {hits}\n"
+    "  Recommendations: {recommendations}\n"
 )
 
-console = Console()
-
 
 # ============================================================
 # Pipeline State
@@ -104,43 +123,84 @@ class PipelineState(BaseModel):
     completed_at: Optional[str] = None
     pdf_files: list[str] = Field(default_factory=list)
 
+    # {output_dir: (tree signature, newest files)} for HITL listings; not serialized
+    _file_cache: dict = PrivateAttr(default_factory=dict)
+    # {"market"|"gdd"|"math"|"compliance": leading 5000 chars of that stage's output},
+    # sliced once when the stage finishes; read through SlotStudioFlow._context
+    _context: dict = PrivateAttr(default_factory=dict)
+
 
 # ============================================================
 # Agent Factory (PHASE 2: Real LLM wiring)
 # ============================================================
 
+def create_market_analyst() -> Agent:
+    """
+    The research-stage analyst. run_research builds a second one for the
+    reference-game teardown, which runs concurrently with the sweep: an
+    Agent can't run two tasks at once.
+    """
+    return Agent(
+        role="Market Intelligence Analyst",
+        goal=(
+            "Conduct DEEP multi-pass market analysis. Use the deep_research tool for "
+            "comprehensive market sweeps — it reads FULL web pages, not just snippets. "
+            "Use competitor_teardown to extract exact RTP, volatility, max win, and feature "
+            "data from top competing games. Produce structured competitive intelligence "
+            "with specific numbers, not vague summaries."
+        ),
+        backstory=(
+            "Data-driven slot market analyst who built the competitive intelligence division "
+            "at a top-5 gaming studio. You don't just search — you READ full articles, "
+            "EXTRACT specific numbers, and CROSS-REFERENCE sources. A 200-char snippet "
+            "is not research. Your reports cite specific RTPs, hit frequencies, and feature "
+            "mechanics from real games. You use deep_research for comprehensive analysis "
+            "and competitor_teardown for structured game data extraction."
+        ),
+        llm=LLMConfig.get_llm("market_analyst"),
+        max_iter=15,  # More iterations for deep research loops
+        verbose=True,
+        tools=[
+            get_tool("deep_research"), get_tool("competitor_teardown"), get_tool("trend_radar"),
+            get_tool("web_fetch"), get_tool("slot_search"), get_tool("file_writer"),
+        ],
+    )
+
+
 def create_agents() -> dict[str, Agent]:
     """
     Build all agents with REAL litellm model strings and tools.
     UPGRADED: Deep research, web fetching, competitor teardown, knowledge base.
     """
 
+    # Shared tool instances (one per process, see tools/registry.py)
     # Core tools
-    slot_search = SlotDatabaseSearchTool()
-    math_sim = MathSimulationTool()
-    image_gen = ImageGenerationTool()
-    reg_rag = RegulatoryRAGTool()
-    file_writer = FileWriterTool()
+    slot_search = get_tool("slot_search")
+    math_sim = get_tool("math_sim")
+    image_gen = get_tool("image_gen")
+    reg_rag = get_tool("reg_rag")
+    file_writer = get_tool("file_writer")
 
     # Advanced tools (UPGRADES 1-4)
-    web_fetch = WebFetchTool()
-    deep_research = DeepResearchTool()
-    competitor_teardown = CompetitorTeardownTool()
-    knowledge_base = KnowledgeBaseTool()
+    web_fetch = get_tool("web_fetch")
+    deep_research = get_tool("deep_research")
+    competitor_teardown = get_tool("competitor_teardown")
+    knowledge_base = get_tool("knowledge_base")
 
     # Tier 1 tools (UPGRADES 6-11)
-    vision_qa = VisionQATool()
-    paytable_optimizer = PaytableOptimizerTool()
-    jurisdiction_intersect = JurisdictionIntersectionTool()
-    player_behavior = PlayerBehaviorModelTool()
-    agent_debate = AgentDebateTool()
-    trend_radar = TrendRadarTool()
+    vision_qa = get_tool("vision_qa")
+    vision_qa_batch = get_tool("vision_qa_batch")
+    paytable_optimizer = get_tool("paytable_optimizer")
+    jurisdiction_intersect = get_tool("jurisdiction_intersect")
+    player_behavior = get_tool("player_behavior")
+    agent_debate = get_tool("agent_debate")
+    trend_radar = get_tool("trend_radar")
 
     # Tier 2 tools (UPGRADES 12-15)
-    patent_scanner = PatentIPScannerTool()
-    prototype_gen = HTML5PrototypeTool()
-    sound_design = SoundDesignTool()
-    cert_planner = CertificationPlannerTool()
+    patent_scanner = get_tool("patent_scanner")
+    prototype_gen = get_tool("prototype_gen")
+    sound_design = get_tool("sound_design")
+    cert_planner = get_tool("cert_planner")
 
     agents = {}
 
@@ -163,28 +223,7 @@ def create_agents() -> dict[str, Agent]:
     )
 
     # ---- Market Analyst (UPGRADED: deep research + web fetch + competitor teardown) ----
-    agents["market_analyst"] = Agent(
-        role="Market Intelligence Analyst",
-        goal=(
-            "Conduct DEEP multi-pass market analysis. Use the deep_research tool for "
-            "comprehensive market sweeps — it reads FULL web pages, not just snippets. "
-            "Use competitor_teardown to extract exact RTP, volatility, max win, and feature "
-            "data from top competing games. Produce structured competitive intelligence "
-            "with specific numbers, not vague summaries."
-        ),
-        backstory=(
-            "Data-driven slot market analyst who built the competitive intelligence division "
-            "at a top-5 gaming studio. You don't just search — you READ full articles, "
-            "EXTRACT specific numbers, and CROSS-REFERENCE sources. A 200-char snippet "
-            "is not research. Your reports cite specific RTPs, hit frequencies, and feature "
-            "mechanics from real games. You use deep_research for comprehensive analysis "
-            "and competitor_teardown for structured game data extraction."
-        ),
-        llm=LLMConfig.get_llm("market_analyst"),
-        max_iter=15,  # More iterations for deep research loops
-        verbose=True,
-        tools=[deep_research, competitor_teardown, trend_radar, web_fetch, slot_search, file_writer],
-    )
+    agents["market_analyst"] = create_market_analyst()
 
     # ---- Game Designer (UPGRADED: knowledge base + competitor data) ----
     agents["game_designer"] = Agent(
@@ -232,9 +271,10 @@ def create_agents() -> dict[str, Agent]:
         role="Art Director, Visual & Audio Designer",
         goal=(
             "Create mood boards for approval, then generate all visual AND audio assets. "
-            "CRITICAL: After generating EVERY image, use vision_qa to check quality, "
-            "theme adherence, regulatory compliance, and mobile readability. If vision_qa "
-            "returns FAIL, regenerate the image with adjusted prompts. "
+            "CRITICAL: EVERY image gets vision QA for quality, theme adherence, regulatory "
+            "compliance, and mobile readability — check each generated set in one "
+            "vision_qa_batch call, and re-check single regenerated images with vision_qa. "
+            "If QA returns FAIL, regenerate the image with adjusted prompts. "
             "Use sound_design to create the audio design brief and generate AI sound effects "
             "for all core game sounds (spin, wins, bonus triggers, ambient). "
             "Use fetch_web_page to research visual references before designing."
@@ -249,7 +289,7 @@ def create_agents() -> dict[str, Agent]:
         llm=LLMConfig.get_llm("art_director"),
         max_iter=15,  # More iterations: generate + QA + regenerate cycle
         verbose=True,
-        tools=[image_gen, vision_qa, sound_design, web_fetch, file_writer],
+        tools=[image_gen, vision_qa, vision_qa_batch, sound_design, web_fetch, file_writer],
     )
 
     # ---- Compliance Officer (UPGRADED: deep research + web fetch for live law lookup) ----
@@ -276,7 +316,6 @@ def create_agents() -> dict[str, Agent]:
     )
 
     # ---- Adversarial Reviewer (NEW — UPGRADE 5) ----
-    from agents.adversarial_reviewer import create_adversarial_reviewer
     agents["adversarial_reviewer"] = create_adversarial_reviewer()
 
     return agents
@@ -286,6 +325,155 @@ def create_agents() -> dict[str, Agent]:
 # HITL Helper (Web + CLI)
 # ============================================================
 
+def _scandir_files(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield the file entries under root. DirEntry caches the type from the
+    directory read, so unlike rglob + is_file() this costs no extra stat
+    per path. Symlinks are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_file(follow_symlinks=False):
+                        yield entry
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except PermissionError:
+            pass
+
+
+_IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".webp"})
+_AUDIO_SUFFIXES = frozenset({".mp3", ".wav"})
+
+
+def _inventory_output(root: Path) -> tuple[list[str], int, int]:
+    """
+    One walk of the finished package: (relative file paths, image count,
+    audio count) for the manifest and the completion panel.
+    """
+    prefix = os.path.join(os.fspath(root), "")
+    plen = len(prefix)
+    files, images, audio = [], 0, 0
+    for entry in _scandir_files(root):
+        files.append(entry.path[plen:])
+        suffix = os.path.splitext(entry.name)[1]
+        if suffix in _IMAGE_SUFFIXES:
+            images += 1
+        elif suffix in _AUDIO_SUFFIXES:
+            audio += 1
+    files.sort()
+    return files, images, audio
+
+
+def _mtime_ns(entry: os.DirEntry) -> int:
+    try:
+        return entry.stat(follow_symlinks=False).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _tree_signature(root: Path) -> tuple:
+    """
+    mtime_ns of every directory under root. Adding, removing or renaming a
+    file anywhere bumps its parent's mtime, so an unchanged signature
+    means an unchanged listing — and computing it stats directories only,
+    never files.
+    """
+    sig = []
+    stack = [os.fspath(root)]
+    while stack:
+        path = stack.pop()
+        try:
+            sig.append((path, os.stat(path).st_mtime_ns))
+            with os.scandir(path) as it:
+                stack.extend(e.path for e in it if e.is_dir(follow_symlinks=False))
+        except OSError:
+            pass
+    return tuple(sig)
+
+
+_FILE_CACHE_SIZE = 16
+
+
+def _hitl_files(name: str, state: PipelineState, limit: int = 20) -> list[str]:
+    """
+    The newest `limit` files in output_dir, relative to it, for the review
+    UI of checkpoint `name`. Entries stream through a size-`limit`
+    heap, so the tree is never held or sorted in full. Back-to-back
+    checkpoints with no files added or removed reuse the previous listing.
+    """
+    if name in PipelineConfig.HITL_STAGES_WITHOUT_FILES:
+        return []
+    out = Path(state.output_dir)
+    if not out.exists():
+        return []
+    cache = state._file_cache
+    sig = _tree_signature(out)
+    hit = cache.get(state.output_dir)
+    if hit is not None and hit[0] == sig:
+        return list(hit[1])
+
+    newest = heapq.nlargest(limit, _scandir_files(out), key=_mtime_ns)
+    # scandir builds entry.path by joining onto root, so the relative path
+    # is a plain slice past the root prefix
+    prefix = os.path.join(os.fspath(out), "")
+    plen = len(prefix)
+    files = sorted(
+        entry.path[plen:] if entry.path.startswith(prefix) else os.path.relpath(entry.path, out)
+        for entry in newest
+    )
+    cache.pop(state.output_dir, None)
+    cache[state.output_dir] = (sig, files)
+    while len(cache) > _FILE_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    return list(files)
+
+
+@lru_cache(maxsize=1)
+def _web_hitl():
+    """
+    tools.web_hitl, bound on the first web checkpoint. Not imported at module
+    load: it creates the reviews table on import, which CLI-only runs don't
+    need. A failed import isn't cached, so it surfaces on each checkpoint.
+    """
+    import tools.web_hitl
+    return tools.web_hitl
+
+
+def _record_hitl(name: str, state: PipelineState, approved: bool, feedback: str) -> bool:
+    state.hitl_approvals[name] = approved
+    if not approved and feedback:
+        state.errors.append(f"HITL rejection at {name}: {feedback}")
+    return approved
+
+
+def _cli_checkpoint(name: str, summary: str, state: PipelineState) -> bool:
+    if sys.stdin.isatty():
+        # Text() renders the summary as-is: no markup parsing, and brackets
+        # in agent output can't be mistaken for style tags
+        console.print(Panel(Text(summary), title=f"🔍 HITL: {name}", border_style="yellow"))
+        approved = Confirm.ask("[bold yellow]Approve?[/bold yellow]", default=True)
+        fb = "" if approved else Prompt.ask("[yellow]Feedback (or 'skip' to abort)[/yellow]")
+    else:
+        # Scripted / CI runs: plain line reads, no Rich prompt loop
+        sys.stdout.write(f"\nHITL: {name}\n{summary}\nApprove? [Y/n]: ")
+        sys.stdout.flush()
+        approved = sys.stdin.readline().strip().lower() not in ("n", "no")
+        fb = ""
+        if not approved:
+            sys.stdout.write("Feedback (or 'skip' to abort): ")
+            sys.stdout.flush()
+            fb = sys.stdin.readline().strip()
+    state.hitl_approvals[name] = approved
+    if not approved and fb.lower() != "skip":
+        state.errors.append(f"HITL rejection at {name}: {fb}")
+    return approved
+
+
 def hitl_checkpoint(name: str, summary: str, state: PipelineState, auto: bool = False) -> bool:
     """
     Human-in-the-loop checkpoint.
@@ -293,6 +481,9 @@ def hitl_checkpoint(name: str, summary: str, state: PipelineState, auto: bool =
     - If state.job_id is set: use web HITL (blocks until user responds in browser)
     - Otherwise: fall back to CLI prompt
     """
+    # The stage name keys hitl_approvals and the review row; interning
+    # makes those lookups identity compares
+    name = sys.intern(name)
     if auto or not PipelineConfig.HITL_ENABLED:
         console.print(f"[dim]⏭ Auto-approved: {name}[/dim]")
         state.hitl_approvals[name] = True
@@ -301,52 +492,51 @@ def hitl_checkpoint(name: str, summary: str, state: PipelineState, auto: bool =
     # Web-based HITL
     if state.job_id:
         try:
-            from tools.web_hitl import web_hitl_checkpoint
-            # Collect file paths relative to output_dir for the review UI
-            files = []
-            out = Path(state.output_dir)
-            if out.exists():
-                for f in sorted(out.rglob("*")):
-                    if f.is_file():
-                        files.append(str(f.relative_to(out)))
-
-            approved, feedback = web_hitl_checkpoint(
+            approved, feedback = _web_hitl().web_hitl_checkpoint(
                 job_id=state.job_id,
                 stage=name,
                 title=name.replace("_", " ").title(),
                 summary=summary,
-                files=files[-20:],  # Last 20 files max
+                files=_hitl_files(name, state),
                 auto=False,
-                timeout=7200,  # 2 hour max wait
+                timeout=PipelineConfig.HITL_TIMEOUT_S,
+                max_poll_interval=PipelineConfig.HITL_POLL_INTERVAL_S,
             )
-            state.hitl_approvals[name] = approved
-            if not approved and feedback:
-                state.errors.append(f"HITL rejection at {name}: {feedback}")
-            return approved
+            return _record_hitl(name, state, approved, feedback)
         except Exception as e:
             console.print(f"[yellow]Web HITL failed ({e}), falling back to CLI[/yellow]")
 
     # CLI fallback
-    console.print(Panel(summary, title=f"🔍 HITL: {name}", border_style="yellow"))
-    approved = Confirm.ask("[bold yellow]Approve?[/bold yellow]", default=True)
-    state.hitl_approvals[name] = approved
-    if not approved:
-        fb = Prompt.ask("[yellow]Feedback (or 'skip' to abort)[/yellow]")
-        if fb.lower() != "skip":
-            state.errors.append(f"HITL rejection at {name}: {fb}")
-    return approved
+    return _cli_checkpoint(name, summary, state)
+
+
+async def hitl_checkpoint_async(name: str, summary: str, state: PipelineState, auto: bool = False) -> bool:
+    """
+    Async hitl_checkpoint for flow listeners. Runs the checkpoint in a
+    worker thread so the web wait, the file walk and the CLI prompt don't
+    hold the event loop.
+    """
+    return await asyncio.to_thread(hitl_checkpoint, name, summary, state, auto)
 
 
 # ============================================================
 # Simulation Template Loader
 # ============================================================
 
+_TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "templates" / "math_simulation.py"
+
+
+@lru_cache(maxsize=1)
 def load_simulation_template() -> str:
-    """Load the base Monte Carlo simulation template for the Math agent."""
-    template_path = Path(__file__).parent.parent / "templates" / "math_simulation.py"
-    if template_path.exists():
-        return template_path.read_text(encoding="utf-8")
-    return "# Simulation template not found — write from scratch"
+    """
+    Load the base Monte Carlo simulation template for the Math agent.
+    Read once per process; call load_simulation_template.cache_clear()
+    after editing the template on disk.
+    """
+    try:
+        return _TEMPLATE_PATH.read_bytes().decode("utf-8")
+    except FileNotFoundError:
+        return "# Simulation template not found — write from scratch"
 
 
 # ============================================================
@@ -358,17 +548,74 @@ class SlotStudioFlow(Flow[PipelineState]):
     def __init__(self, auto_mode: bool = False, **kwargs):
         super().__init__(**kwargs)
         self.auto_mode = auto_mode
-        self.agents = create_agents()
+        # Build agents off the constructor's thread; see agents. The pool's
+        # one thread exits once create_agents returns.
+        factory = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-factory")
+        self._agents_future = factory.submit(create_agents)
+        factory.shutdown(wait=False)
         self.cost_tracker = CostTracker()
+        self.output_path: Optional[Path] = None  # set by initialize()
+        self.dirs: dict[str, Path] = {}
+        # Feature/market renderings shared by every stage's prompts; set by initialize()
+        self._feature_values: list[str] = []
+        self._feature_labels: list[str] = []
+        self._feature_labels_title: list[str] = []
+        self._markets_csv = ""
+        self._pending_reviews: dict[str, Future] = {}  # {stage: review started by _start_review}
+        self._review_runner: Optional[ThreadPoolExecutor] = None  # this run's review pool; see kickoff
+        self._review_paths: dict[str, Path] = {}  # see _review_path
+
+    @property
+    def agents(self) -> dict:
+        """
+        Agents from create_agents(). Building them (LLM clients, tool
+        imports) runs in the background from __init__ and overlaps with
+        initialize and pre-flight; the first stage that needs an agent
+        waits for it here. Errors from create_agents surface on this access.
+        """
+        return self._agents_future.result()
+
+    def kickoff(self, *args, **kwargs):
+        # Checkpoint reviews started by _start_review run on this run's own
+        # pool, so one job's reviews never queue behind another job's
+        self._review_runner = ThreadPoolExecutor(max_workers=2, thread_name_prefix="adversarial-review")
+        try:
+            # Agents share tool instances; dedupe identical read-only calls for this run
+            with tool_run_cache():
+                return super().kickoff(*args, **kwargs)
+        finally:
+            # A finished run has awaited every review; an aborted one drops
+            # the reviews still queued
+            self._review_runner.shutdown(wait=False, cancel_futures=True)
+            self._pending_reviews.clear()
+
+    def _note(self, message: str):
+        """
+        Dim, informational status line. Printed for interactive runs;
+        skipped in auto mode, where nobody is watching and worker.py just
+        appends console output to the job log.
+        """
+        if not self.auto_mode:
+            console.print(f"[dim]{message}[/dim]")
+
+    def _context(self, name: str, limit: int) -> str:
+        """First `limit` chars of a finished stage's output ("" if it didn't run)."""
+        return self.state._context.get(name, "")[:limit]
 
     # ---- Stage 1: Initialize ----
 
     @start()
     def initialize(self):
+        idea = self.state.game_idea
+        self._feature_values = [f.value for f in idea.requested_features]
+        self._feature_labels = [v.replace("_", " ") for v in self._feature_values]
+        self._feature_labels_title = [label.title() for label in self._feature_labels]
+        self._markets_csv = ", ".join(idea.target_markets)
+
         console.print(Panel(
             f"[bold]🎰 Automated Slot Studio[/bold]\n\n"
             f"Theme: {self.state.game_idea.theme}\n"
-            f"Markets: {', '.join(self.state.game_idea.target_markets)}\n"
+            f"Markets: {self._markets_csv}\n"
             f"Volatility: {self.state.game_idea.volatility.value}\n"
             f"RTP: {self.state.game_idea.target_rtp}% | Max Win: {self.state.game_idea.max_win_multiplier}x\n\n"
             f"LLM Routing:\n"
@@ -376,25 +623,27 @@ class SlotStudioFlow(Flow[PipelineState]):
             f"  Light (Analyst/Art):         {LLMConfig.LIGHT}",
             title="Pipeline Starting", border_style="green",
         ))
-        self.state.started_at = datetime.now().isoformat()
-        slug = "".join(c if c.isalnum() else "_" for c in self.state.game_idea.theme.lower())[:40]
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        self.state.started_at = now.isoformat()
+        slug = _SLUG_RE.sub("_", self.state.game_idea.theme.lower())[:40]
+        ts = now.strftime("%Y%m%d_%H%M%S")
         self.state.game_slug = f"{slug}_{ts}"
-        self.state.output_dir = str(Path(os.getenv("OUTPUT_DIR", "./output")) / self.state.game_slug)
-        for sub in ["00_preflight", "01_research", "02_design", "03_math", "04_art/mood_boards",
-                     "04_art/symbols", "04_art/backgrounds", "04_art/ui",
-                     "04_audio", "05_legal", "06_pdf", "07_prototype"]:
-            Path(self.state.output_dir, sub).mkdir(parents=True, exist_ok=True)
+        self.output_path = Path(os.getenv("OUTPUT_DIR", "./output")) / self.state.game_slug
+        self.state.output_dir = str(self.output_path)
+        # Every stage directory is created here, once; later writes just use self.dirs
+        self.dirs = {sub: self.output_path / sub for sub in OUTPUT_SUBDIRS}
+        for d in self.dirs.values():
+            d.mkdir(parents=True, exist_ok=True)
         console.print(f"[green]📁 Output: {self.state.output_dir}[/green]")
 
     # ---- Stage 2: Pre-Flight Intelligence ----
 
-    @listen(initialize)
-    def run_preflight(self):
-        console.print("\n[bold cyan]🛰️ Stage 0: Pre-Flight Intelligence[/bold cyan]\n")
-        idea = self.state.game_idea
+    # Pre-flight artifacts are read back by later stages and the web job
+    # page, not opened by reviewers, so they're written compact. Research,
+    # reviews and the manifest stay indented for the humans who read them.
 
-        # A) Trend Radar — is this theme trending up or saturated?
+    def _preflight_trend_radar(self, idea):
+        """A) Trend Radar — is this theme trending up or saturated?"""
         try:
             console.print("[cyan]📡 Running trend radar...[/cyan]")
             radar = TrendRadarTool()
@@ -404,28 +653,24 @@ class SlotStudioFlow(Flow[PipelineState]):
                 theme_filter=idea.theme.split()[0] if idea.theme else "",
             ))
             self.state.trend_radar = radar_result
-            Path(self.state.output_dir, "00_preflight", "trend_radar.json").parent.mkdir(parents=True, exist_ok=True)
-            Path(self.state.output_dir, "00_preflight", "trend_radar.json").write_text(
-                json.dumps(radar_result, indent=2), encoding="utf-8"
-            )
+            write_json(self.dirs["00_preflight"] / "trend_radar.json", radar_result, indent=False)
             console.print("[green]✅ Trend radar complete[/green]")
         except Exception as e:
             console.print(f"[yellow]⚠️ Trend radar failed (non-fatal): {e}[/yellow]")
 
-        # B) Jurisdiction Intersection — hard constraints for all target markets
+    def _preflight_jurisdiction(self, idea):
+        """B) Jurisdiction Intersection — hard constraints for all target markets"""
         try:
             console.print("[cyan]⚖️ Computing jurisdiction intersection...[/cyan]")
             jx = JurisdictionIntersectionTool()
             jx_result = json.loads(jx._run(
                 markets=idea.target_markets,
                 proposed_rtp=idea.target_rtp,
-                proposed_features=[f.value for f in idea.requested_features],
+                proposed_features=self._feature_values,
                 proposed_max_win=idea.max_win_multiplier,
             ))
             self.state.jurisdiction_constraints = jx_result
-            Path(self.state.output_dir, "00_preflight", "jurisdiction_constraints.json").write_text(
-                json.dumps(jx_result, indent=2), encoding="utf-8"
-            )
+            write_json(self.dirs["00_preflight"] / "jurisdiction_constraints.json", jx_result, indent=False)
 
             # Check for blockers
             blockers = jx_result.get("intersection", {}).get("blockers", [])
@@ -437,36 +682,34 @@ class SlotStudioFlow(Flow[PipelineState]):
         except Exception as e:
             console.print(f"[yellow]⚠️ Jurisdiction check failed (non-fatal): {e}[/yellow]")
 
-        # C) Knowledge Base — learn from past designs
+    def _preflight_knowledge_base(self, idea):
+        """C) Knowledge Base — learn from past designs"""
         try:
             console.print("[cyan]🧠 Checking knowledge base for past designs...[/cyan]")
-            kb = KnowledgeBaseTool()
+            kb = get_tool("knowledge_base")
             kb_result = json.loads(kb._run(action="search", query=f"{idea.theme} {idea.volatility.value} slot game"))
             if kb_result.get("results_count", 0) > 0:
-                Path(self.state.output_dir, "00_preflight", "past_designs.json").write_text(
-                    json.dumps(kb_result, indent=2), encoding="utf-8"
-                )
+                write_json(self.dirs["00_preflight"] / "past_designs.json", kb_result, indent=False)
                 console.print(f"[green]✅ Found {kb_result['results_count']} past designs to reference[/green]")
             else:
-                console.print("[dim]No past designs found — this is a fresh concept[/dim]")
+                self._note("No past designs found — this is a fresh concept")
         except Exception as e:
-            console.print(f"[dim]Knowledge base not available: {e}[/dim]")
+            self._note(f"Knowledge base not available: {e}")
 
-        # D) Patent / IP Scan — check proposed mechanics for conflicts
+    def _preflight_patent_scan(self, idea):
+        """D) Patent / IP Scan — check proposed mechanics for conflicts"""
         try:
             console.print("[cyan]🔍 Scanning for patent/IP conflicts...[/cyan]")
             scanner = PatentIPScannerTool()
             # Build mechanic description from features
-            features_desc = ", ".join(f.value.replace("_", " ") for f in idea.requested_features)
+            features_desc = ", ".join(self._feature_labels)
             scan_result = json.loads(scanner._run(
                 mechanic_description=f"{features_desc} slot game mechanic",
-                keywords=[f.value.replace("_", " ") for f in idea.requested_features],
+                keywords=self._feature_labels,
                 theme_name=idea.theme,
             ))
             self.state.patent_scan = scan_result
-            Path(self.state.output_dir, "00_preflight", "patent_scan.json").write_text(
-                json.dumps(scan_result, indent=2), encoding="utf-8"
-            )
+            write_json(self.dirs["00_preflight"] / "patent_scan.json", scan_result, indent=False)
             risk = scan_result.get("risk_assessment", {}).get("overall_ip_risk", "UNKNOWN")
             if risk == "HIGH":
                 console.print(f"[bold red]🚨 HIGH IP RISK: {scan_result.get('recommendations', [])}[/bold red]")
@@ -475,46 +718,88 @@ class SlotStudioFlow(Flow[PipelineState]):
         except Exception as e:
             console.print(f"[yellow]⚠️ Patent scan failed (non-fatal): {e}[/yellow]")
 
-        # E) State Recon Data — pull any cached recon results for US state markets
+    def _preflight_recon(self, idea):
+        """E) State Recon Data — pull any cached recon results for US state markets"""
         try:
             from tools.qdrant_store import JurisdictionStore
             store = JurisdictionStore()
-            for market in idea.target_markets:
+            markets = list(idea.target_markets)
+            if not markets:
+                return
+            if store.is_available:
+                store._get_client()  # build the shared client before the workers race for it
+
+            def lookup(market):
                 results = store.search(f"{market} gambling law requirements", jurisdiction=market, limit=3)
                 if results and "error" not in results[0]:
-                    console.print(f"[green]✅ Found recon data for {market} in Qdrant[/green]")
-                    recon_path = Path(self.state.output_dir, "00_preflight", f"recon_{market.lower().replace(' ', '_')}.json")
-                    recon_path.write_text(json.dumps(results, indent=2, default=str), encoding="utf-8")
+                    recon_path = self.dirs["00_preflight"] / f"recon_{market.lower().replace(' ', '_')}.json"
+                    write_json(recon_path, results, indent=False)
+                    return True
+                return False
+
+            # Markets are independent round-trips; the pool size caps
+            # concurrent Qdrant requests
+            with ThreadPoolExecutor(max_workers=min(PipelineConfig.RECON_LOOKUP_WORKERS, len(markets))) as pool:
+                futures = {pool.submit(lookup, market): market for market in markets}
+                for future in as_completed(futures):
+                    if future.result():
+                        console.print(f"[green]✅ Found recon data for {futures[future]} in Qdrant[/green]")
         except Exception as e:
-            console.print(f"[dim]Qdrant recon lookup skipped: {e}[/dim]")
-
-    # ---- Stage 2b: Research ----
+            self._note(f"Qdrant recon lookup skipped: {e}")
 
-    @listen(run_preflight)
-    def run_research(self):
-        console.print("\n[bold blue]📊 Stage 1: Market Research[/bold blue]\n")
+    @listen(initialize)
+    async def run_preflight(self):
+        console.print("\n[bold cyan]🛰️ Stage 0: Pre-Flight Intelligence[/bold cyan]\n")
         idea = self.state.game_idea
 
-        # Pre-flight context for research agents
-        preflight_ctx = ""
+        # A-E are independent lookups (each writes its own state field and
+        # file, and handles its own errors), so the stage costs the slowest
+        # one instead of the sum of all five. The Math agent's simulation
+        # template is read alongside them so run_design_and_math gets it
+        # from load_simulation_template's cache.
+        await asyncio.gather(
+            asyncio.to_thread(load_simulation_template),
+            asyncio.to_thread(self._preflight_trend_radar, idea),
+            asyncio.to_thread(self._preflight_jurisdiction, idea),
+            asyncio.to_thread(self._preflight_knowledge_base, idea),
+            asyncio.to_thread(self._preflight_patent_scan, idea),
+            asyncio.to_thread(self._preflight_recon, idea),
+        )
+
+    # ---- Stage 2b: Research ----
+
+    def _preflight_context(self) -> str:
+        """Pre-flight findings as prompt text for the research agents."""
+        parts = []
         if self.state.trend_radar:
             top_themes = self.state.trend_radar.get("trending_themes", [])[:5]
-            preflight_ctx += f"\nTREND RADAR: Top themes = {json.dumps(top_themes)}\n"
+            parts.append(f"\nTREND RADAR: Top themes = {json.dumps(top_themes)}\n")
             if self.state.trend_radar.get("theme_analysis"):
-                preflight_ctx += f"Theme analysis: {json.dumps(self.state.trend_radar['theme_analysis'])}\n"
+                parts.append(f"Theme analysis: {json.dumps(self.state.trend_radar['theme_analysis'])}\n")
         if self.state.jurisdiction_constraints:
             jx = self.state.jurisdiction_constraints.get("intersection", {})
-            preflight_ctx += f"\nJURISDICTION CONSTRAINTS:\n"
-            preflight_ctx += f"  RTP floor: {jx.get('rtp_floor', 'unknown')}%\n"
-            preflight_ctx += f"  Banned features: {jx.get('banned_features', {})}\n"
-            preflight_ctx += f"  Required features: {jx.get('required_features_union', [])}\n"
-            preflight_ctx += f"  Blockers: {jx.get('blockers', [])}\n"
+            parts.append(_JURISDICTION_CTX.format(
+                rtp_floor=jx.get("rtp_floor", "unknown"),
+                banned=jx.get("banned_features", {}),
+                required=jx.get("required_features_union", []),
+                blockers=jx.get("blockers", []),
+            ))
         if self.state.patent_scan:
             risk = self.state.patent_scan.get("risk_assessment", {})
-            preflight_ctx += f"\nPATENT SCAN:\n"
-            preflight_ctx += f"  Overall IP risk: {risk.get('overall_ip_risk', 'unknown')}\n"
-            preflight_ctx += f"  Known patent hits: {self.state.patent_scan.get('known_patent_hits', [])}\n"
-            preflight_ctx += f"  Recommendations: {self.state.patent_scan.get('recommendations', [])}\n"
+            parts.append(_PATENT_CTX.format(
+                risk=risk.get("overall_ip_risk", "unknown"),
+                hits=self.state.patent_scan.get("known_patent_hits", []),
+                recommendations=self.state.patent_scan.get("recommendations", []),
+            ))
+        return "".join(parts)
+
+    @listen(run_preflight)
+    def run_research(self):
+        console.print("\n[bold blue]📊 Stage 1: Market Research[/bold blue]\n")
+        idea = self.state.game_idea
+
+        # Pre-flight context for research agents
+        preflight_ctx = self._preflight_context()
 
         sweep_task = Task(
             description=(
@@ -531,23 +816,41 @@ class SlotStudioFlow(Flow[PipelineState]):
             agent=self.agents["market_analyst"],
         )
 
+        # The user-named reference games are known up front, so their
+        # teardown runs alongside the broad sweep (async_execution) rather
+        # than after it; the synthesis task waits on both.
+        prefetch_tasks = []
+        if idea.competitor_references:
+            prefetch_tasks.append(Task(
+                description=(
+                    f"Research these reference games for '{idea.theme}': "
+                    f"{', '.join(idea.competitor_references)}.\n"
+                    f"For each: provider, RTP, volatility, max win, features, player sentiment.\n"
+                    f"Use deep_research and competitor_teardown. Output as JSON."
+                ),
+                expected_output="JSON profile of each reference game",
+                agent=create_market_analyst(),
+                async_execution=True,
+            ))
+
         dive_task = Task(
             description=(
                 f"Deep-dive on top {PipelineConfig.COMPETITOR_DEEP_DIVE_LIMIT} competitors "
                 f"plus references: {', '.join(idea.competitor_references)}.\n"
                 f"For each: provider, RTP, volatility, max win, features, player sentiment.\n"
+                f"Reference games already profiled in your context don't need re-researching.\n"
                 f"Synthesize differentiation strategy: primary_differentiator, mechanic_opportunities, "
                 f"theme_twist, visual_differentiation, player_pain_points.\n"
                 f"Output as JSON."
             ),
             expected_output="JSON competitor analysis + differentiation strategy",
             agent=self.agents["market_analyst"],
-            context=[sweep_task],
+            context=[sweep_task, *prefetch_tasks],
         )
 
         crew = Crew(
-            agents=[self.agents["market_analyst"]],
-            tasks=[sweep_task, dive_task],
+            agents=[self.agents["market_analyst"], *(t.agent for t in prefetch_tasks)],
+            tasks=[*prefetch_tasks, sweep_task, dive_task],
             process=Process.sequential, verbose=True,
         )
         result = crew.kickoff()
@@ -557,23 +860,23 @@ class SlotStudioFlow(Flow[PipelineState]):
             "deep_dive": str(dive_task.output),
             "raw": str(result),
         }
-        Path(self.state.output_dir, "01_research", "market_research.json").write_text(
-            json.dumps(self.state.market_research, indent=2, default=str), encoding="utf-8"
-        )
+        self.state._context["market"] = json.dumps(self.state.market_research, default=str)[:_CONTEXT_CHARS]
+        self._start_review("post_research",
+            f"Theme: {self.state.game_idea.theme}\n"
+            f"Market Research Output: {self._context('market', 3000)}")
+        write_json(self.dirs["01_research"] / "market_research.json", self.state.market_research)
         console.print("[green]✅ Research complete[/green]")
 
     @listen(run_research)
-    def checkpoint_research(self):
-        # Run adversarial review before HITL
-        self._run_adversarial_review("post_research",
-            f"Theme: {self.state.game_idea.theme}\n"
-            f"Market Research Output: {json.dumps(self.state.market_research, default=str)[:3000]}")
+    async def checkpoint_research(self):
+        # Adversarial review (started by run_research) must land before HITL
+        await self._await_review("post_research")
 
-        self.state.research_approved = hitl_checkpoint(
+        self.state.research_approved = await hitl_checkpoint_async(
             "post_research",
             f"Research complete for '{self.state.game_idea.theme}'.\n"
             f"See: {self.state.output_dir}/01_research/\n"
-            f"Adversarial review: {self.state.output_dir}/adversarial_review_post_research.md",
+            f"Adversarial review: {self._review_path('post_research')}",
             self.state, auto=self.auto_mode,
         )
 
@@ -585,7 +888,7 @@ class SlotStudioFlow(Flow[PipelineState]):
             return
         console.print("\n[bold yellow]📄 Stage 2: Design & Math[/bold yellow]\n")
         idea = self.state.game_idea
-        market_ctx = json.dumps(self.state.market_research, default=str)[:5000]
+        market_ctx = self._context("market", 5000)
         sim_template = load_simulation_template()
 
         gdd_task = Task(
@@ -593,7 +896,7 @@ class SlotStudioFlow(Flow[PipelineState]):
                 f"Write the complete Game Design Document.\n\n"
                 f"Theme: {idea.theme} | Grid: {idea.grid_cols}x{idea.grid_rows}, {idea.ways_or_lines}\n"
                 f"Volatility: {idea.volatility.value} | RTP: {idea.target_rtp}% | Max Win: {idea.max_win_multiplier}x\n"
-                f"Features: {[f.value for f in idea.requested_features]}\n"
+                f"Features: {self._feature_values}\n"
                 f"Art Style: {idea.art_style}\n\n"
                 f"MARKET CONTEXT:\n{market_ctx}\n\n"
                 f"Include: 5 high-pay symbols, 4 low-pay, Wild, Scatter with pay values.\n"
@@ -643,33 +946,33 @@ class SlotStudioFlow(Flow[PipelineState]):
 
         self.state.gdd = {"output": str(gdd_task.output)}
         self.state.math_model = {"output": str(math_task.output)}
+        self.state._context["gdd"] = self.state.gdd["output"][:_CONTEXT_CHARS]
+        self.state._context["math"] = self.state.math_model["output"][:_CONTEXT_CHARS]
+        self._start_review("post_design_math",
+            f"Theme: {self.state.game_idea.theme}\n"
+            f"Markets: {self.state.game_idea.target_markets}\n"
+            f"GDD: {self._context('gdd', 2000)}\n"
+            f"Math: {self._context('math', 2000)}")
 
         # Try to load simulation results if the math agent saved them
-        sim_path = Path(self.state.output_dir, "03_math", "simulation_results.json")
-        if sim_path.exists():
-            try:
-                self.state.math_model["results"] = json.loads(sim_path.read_text())
-            except json.JSONDecodeError:
-                pass
+        sim_results = read_json(self.dirs["03_math"] / "simulation_results.json")
+        if sim_results is not None:
+            self.state.math_model["results"] = sim_results
 
         console.print("[green]✅ GDD + Math complete[/green]")
 
     @listen(run_design_and_math)
-    def checkpoint_design(self):
+    async def checkpoint_design(self):
         if not self.state.research_approved:
             return
-        # Adversarial review of GDD + Math
-        self._run_adversarial_review("post_design_math",
-            f"Theme: {self.state.game_idea.theme}\n"
-            f"Markets: {self.state.game_idea.target_markets}\n"
-            f"GDD: {str(self.state.gdd.get('output',''))[:2000]}\n"
-            f"Math: {str(self.state.math_model.get('output',''))[:2000]}")
+        # Adversarial review of GDD + Math (started by run_design_and_math)
+        await self._await_review("post_design_math")
 
-        self.state.design_math_approved = hitl_checkpoint(
+        self.state.design_math_approved = await hitl_checkpoint_async(
             "post_design_math",
             f"GDD + Math complete. This is the CRITICAL checkpoint.\n"
             f"GDD: {self.state.output_dir}/02_design/\nMath: {self.state.output_dir}/03_math/\n"
-            f"Adversarial review: {self.state.output_dir}/adversarial_review_post_design_math.md",
+            f"Adversarial review: {self._review_path('post_design_math')}",
             self.state, auto=self.auto_mode,
         )
 
@@ -687,9 +990,10 @@ class SlotStudioFlow(Flow[PipelineState]):
                 f"Style: {idea.art_style}\n\n"
                 f"For each variant: define style direction, color palette (6-8 hex codes), mood keywords.\n"
                 f"Use the generate_image tool to create a concept image for each variant.\n"
-                f"CRITICAL: After EACH image, use vision_qa to check quality:\n"
+                f"CRITICAL: After generating ALL variants, call vision_qa_batch ONCE with every\n"
+                f"image path (qa_context='mood_board') to check:\n"
                 f"  - Theme adherence, distinctiveness, scalability, emotional impact\n"
-                f"  - If vision_qa returns FAIL, adjust the prompt and regenerate\n"
+                f"  - If a variant FAILs, adjust its prompt, regenerate it, and re-check it with vision_qa\n"
                 f"Save images to: {self.state.output_dir}/04_art/mood_boards/\n"
                 f"Save QA results to: {self.state.output_dir}/04_art/mood_boards/qa_report.json\n"
                 f"Recommend the best variant for differentiation."
@@ -700,22 +1004,23 @@ class SlotStudioFlow(Flow[PipelineState]):
         crew = Crew(agents=[self.agents["art_director"]], tasks=[mood_task], process=Process.sequential, verbose=True)
         result = crew.kickoff()
         self.state.mood_board = {"output": str(result)}
+        self._start_review("post_art_review",
+            f"Theme: {self.state.game_idea.theme}\n"
+            f"Art Style: {self.state.game_idea.art_style}\n"
+            f"Mood Board Output: {self.state.mood_board['output'][:2000]}")
         console.print("[green]✅ Mood boards generated[/green]")
 
     @listen(run_mood_boards)
-    def checkpoint_art(self):
+    async def checkpoint_art(self):
         if not self.state.design_math_approved:
             return
-        # Adversarial review of art
-        self._run_adversarial_review("post_art_review",
-            f"Theme: {self.state.game_idea.theme}\n"
-            f"Art Style: {self.state.game_idea.art_style}\n"
-            f"Mood Board Output: {str(self.state.mood_board.get('output',''))[:2000]}")
+        # Adversarial review of art (started by run_mood_boards)
+        await self._await_review("post_art_review")
 
-        self.state.mood_board_approved = hitl_checkpoint(
+        self.state.mood_board_approved = await hitl_checkpoint_async(
             "post_art_review",
             f"Mood boards in: {self.state.output_dir}/04_art/mood_boards/\n"
-            f"Adversarial review: {self.state.output_dir}/adversarial_review_post_art_review.md\n"
+            f"Adversarial review: {self._review_path('post_art_review')}\n"
             f"Select preferred direction.",
             self.state, auto=self.auto_mode,
         )
@@ -723,13 +1028,13 @@ class SlotStudioFlow(Flow[PipelineState]):
     # ---- Stage 5: Full Production ----
 
     @listen(checkpoint_art)
-    def run_production(self):
+    async def run_production(self):
         if not self.state.mood_board_approved:
             return
         console.print("\n[bold magenta]🎨⚖️ Stage 3b: Production + Compliance[/bold magenta]\n")
         idea = self.state.game_idea
-        gdd_ctx = str(self.state.gdd.get("output", ""))[:5000]
-        math_ctx = str(self.state.math_model.get("output", ""))[:3000]
+        gdd_ctx = self._context("gdd", 5000)
+        math_ctx = self._context("math", 3000)
 
         art_task = Task(
             description=(
@@ -738,12 +1043,14 @@ class SlotStudioFlow(Flow[PipelineState]):
                 f"Generate with the generate_image tool:\n"
                 f"1. Each symbol (high-pay, low-pay, wild, scatter)\n"
                 f"2. Base game background\n3. Feature background\n4. Game logo\n\n"
-                f"CRITICAL: After EACH image, use vision_qa to check:\n"
+                f"CRITICAL: QA each group with ONE vision_qa_batch call once the group is generated\n"
+                f"(all symbols with qa_context='slot_symbol', both backgrounds with 'background'),\n"
+                f"and the logo with vision_qa (qa_context='logo'). Check:\n"
                 f"  - Symbols: distinguishability at 64px, color contrast, theme match\n"
                 f"  - Backgrounds: readability, mobile crop, UI overlay compatibility\n"
                 f"  - Logo: legibility, scalability, brand impact\n"
                 f"  - ALL: UK ASA compliance (no minor appeal)\n"
-                f"If vision_qa returns FAIL, regenerate with adjusted prompts.\n\n"
+                f"If an image FAILs, regenerate it with adjusted prompts and re-check it with vision_qa.\n\n"
                 f"THEN generate the complete audio package:\n"
                 f"  Use sound_design with action='full' to create:\n"
                 f"  - Audio design brief document\n"
@@ -781,52 +1088,47 @@ class SlotStudioFlow(Flow[PipelineState]):
             agent=self.agents["compliance_officer"],
         )
 
-        crew = Crew(
-            agents=[self.agents["art_director"], self.agents["compliance_officer"]],
-            tasks=[art_task, compliance_task],
-            process=Process.sequential, verbose=True,
+        # Compliance works from the GDD/math context only, never the art
+        # output, so it runs alongside the (much longer) art + audio crew.
+        art_crew = Crew(agents=[self.agents["art_director"]], tasks=[art_task],
+                        process=Process.sequential, verbose=True)
+        compliance_crew = Crew(agents=[self.agents["compliance_officer"]], tasks=[compliance_task],
+                               process=Process.sequential, verbose=True)
+        await asyncio.gather(
+            asyncio.to_thread(art_crew.kickoff),
+            asyncio.to_thread(compliance_crew.kickoff),
         )
-        result = crew.kickoff()
         self.state.art_assets = {"output": str(art_task.output)}
         self.state.compliance = {"output": str(compliance_task.output)}
+        self.state._context["compliance"] = self.state.compliance["output"][:_CONTEXT_CHARS]
 
         # Try to load structured compliance results
-        comp_path = Path(self.state.output_dir, "05_legal", "compliance_report.json")
-        if comp_path.exists():
-            try:
-                self.state.compliance["results"] = json.loads(comp_path.read_text())
-            except json.JSONDecodeError:
-                pass
+        comp_results = read_json(self.dirs["05_legal"] / "compliance_report.json")
+        if comp_results is not None:
+            self.state.compliance["results"] = comp_results
 
         # Try to load cert plan
-        cert_path = Path(self.state.output_dir, "05_legal", "certification_plan.json")
-        if cert_path.exists():
-            try:
-                self.state.certification_plan = json.loads(cert_path.read_text())
-            except json.JSONDecodeError:
-                pass
+        cert_plan = read_json(self.dirs["05_legal"] / "certification_plan.json")
+        if cert_plan is not None:
+            self.state.certification_plan = cert_plan
 
         # Check for generated audio
-        audio_dir = Path(self.state.output_dir, "04_audio")
-        audio_files = list(audio_dir.glob("*.mp3")) + list(audio_dir.glob("*.wav"))
-        if audio_files:
-            self.state.sound_design = {"files_count": len(audio_files), "path": str(audio_dir)}
-            console.print(f"[green]🔊 {len(audio_files)} audio files generated[/green]")
+        audio_dir = self.dirs["04_audio"]
+        with os.scandir(audio_dir) as it:
+            audio_count = sum(
+                1 for entry in it
+                if entry.is_file() and os.path.splitext(entry.name)[1] in _AUDIO_SUFFIXES
+            )
+        if audio_count:
+            self.state.sound_design = {"files_count": audio_count, "path": str(audio_dir)}
+            console.print(f"[green]🔊 {audio_count} audio files generated[/green]")
 
         console.print("[green]✅ Production + Compliance complete[/green]")
 
     # ---- Stage 6: Assembly + PDF Generation ----
 
-    @listen(run_production)
-    def assemble_package(self):
-        if not self.state.mood_board_approved:
-            return
-        console.print("\n[bold green]📦 Stage 4: Assembly + PDF Generation[/bold green]\n")
-
-        output_path = Path(self.state.output_dir)
-        pdf_dir = output_path / "06_pdf"
-
-        # ---- Generate HTML5 Prototype ----
+    def _generate_prototype(self):
+        """Generate the playable HTML5 prototype into 07_prototype/."""
         try:
             console.print("[cyan]🎮 Generating AI-themed HTML5 prototype...[/cyan]")
             proto = HTML5PrototypeTool()
@@ -834,13 +1136,13 @@ class SlotStudioFlow(Flow[PipelineState]):
 
             # Extract symbols from GDD if available
             symbols = ["👑", "💎", "🏆", "🌟", "A", "K", "Q", "J", "10"]
-            features = [f.value.replace("_", " ").title() for f in idea.requested_features]
+            features = self._feature_labels_title
 
             # Gather context from earlier pipeline stages
-            gdd_ctx = str(self.state.gdd.get("output", ""))[:3000] if self.state.gdd else ""
-            math_ctx = str(self.state.math_model.get("output", ""))[:2000] if self.state.math_model else ""
-            art_dir = str(output_path / "04_art")
-            audio_dir = str(output_path / "04_audio")
+            gdd_ctx = self._context("gdd", 3000)
+            math_ctx = self._context("math", 2000)
+            art_dir = str(self.output_path / "04_art")
+            audio_dir = str(self.output_path / "04_audio")
 
             proto_result = json.loads(proto._run(
                 game_title=idea.theme,
@@ -850,7 +1152,7 @@ class SlotStudioFlow(Flow[PipelineState]):
                 symbols=symbols,
                 features=features,
                 target_rtp=idea.target_rtp,
-                output_dir=str(output_path / "07_prototype"),
+                output_dir=str(self.output_path / "07_prototype"),
                 paytable_summary=f"Target RTP: {idea.target_rtp}% | Volatility: {idea.volatility.value} | Max Win: {idea.max_win_multiplier}x",
                 art_dir=art_dir,
                 audio_dir=audio_dir,
@@ -867,7 +1169,8 @@ class SlotStudioFlow(Flow[PipelineState]):
         except Exception as e:
             console.print(f"[yellow]⚠️ Prototype generation failed (non-fatal): {e}[/yellow]")
 
-        # ---- Generate PDFs ----
+    def _generate_pdfs(self):
+        """Render the PDF deliverables into 06_pdf/."""
         try:
             from tools.pdf_generator import generate_full_package
 
@@ -879,9 +1182,9 @@ class SlotStudioFlow(Flow[PipelineState]):
                 "grid": f"{self.state.game_idea.grid_cols}x{self.state.game_idea.grid_rows}",
                 "ways": self.state.game_idea.ways_or_lines,
                 "max_win": self.state.game_idea.max_win_multiplier,
-                "markets": ", ".join(self.state.game_idea.target_markets),
+                "markets": self._markets_csv,
                 "art_style": self.state.game_idea.art_style,
-                "features": [f.value for f in self.state.game_idea.requested_features],
+                "features": self._feature_values,
             }
 
             # Try to extract structured data for PDFs
@@ -890,7 +1193,7 @@ class SlotStudioFlow(Flow[PipelineState]):
             compliance_data = self.state.compliance.get("results", None) if self.state.compliance else None
 
             pdf_files = generate_full_package(
-                output_dir=str(pdf_dir),
+                output_dir=str(self.dirs["06_pdf"]),
                 game_title=self.state.game_idea.theme,
                 game_params=game_params,
                 research_data=self.state.market_research,
@@ -905,16 +1208,34 @@ class SlotStudioFlow(Flow[PipelineState]):
             console.print(f"[yellow]⚠️ PDF generation error: {e}[/yellow]")
             self.state.errors.append(f"PDF generation failed: {e}")
 
+    @listen(run_production)
+    async def assemble_package(self):
+        if not self.state.mood_board_approved:
+            return
+        console.print("\n[bold green]📦 Stage 4: Assembly + PDF Generation[/bold green]\n")
+
+        output_path = self.output_path
+
+        # The prototype (writes 07_prototype/) and the PDFs (write 06_pdf/)
+        # only read finished state, so they run side by side; each handles
+        # its own errors.
+        await asyncio.gather(
+            asyncio.to_thread(self._generate_prototype),
+            asyncio.to_thread(self._generate_pdfs),
+        )
+
         # ---- Build Manifest ----
-        all_files = [str(f.relative_to(output_path)) for f in output_path.rglob("*") if f.is_file()]
-        image_count = len([f for f in output_path.rglob("*") if f.suffix in (".png", ".jpg", ".webp")])
+        all_files, image_count, audio_count = _inventory_output(output_path)
 
         cost_summary = self.cost_tracker.summary()
+        finished_at = datetime.now().isoformat()
+        # One JSON-ready dump (enums already as values) for the manifest and the KB record
+        idea = self.state.game_idea.model_dump(mode="json")
 
         manifest = {
             "game_title": self.state.game_idea.theme,
             "game_slug": self.state.game_slug,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": finished_at,
             "pipeline_version": "4.0.0",  # Tier 2 upgrades
             "llm_routing": {
                 "heavy_model": LLMConfig.HEAVY,
@@ -937,7 +1258,7 @@ class SlotStudioFlow(Flow[PipelineState]):
                 "certification_plan": bool(self.state.certification_plan),
             },
             "cost": cost_summary,
-            "input_parameters": self.state.game_idea.model_dump(),
+            "input_parameters": idea,
             "files_generated": all_files,
             "pdf_files": self.state.pdf_files,
             "total_files": len(all_files),
@@ -945,53 +1266,49 @@ class SlotStudioFlow(Flow[PipelineState]):
             "hitl_approvals": self.state.hitl_approvals,
             "errors": self.state.errors,
             "started_at": self.state.started_at,
-            "completed_at": datetime.now().isoformat(),
+            "completed_at": finished_at,
         }
 
-        (output_path / "PACKAGE_MANIFEST.json").write_text(
-            json.dumps(manifest, indent=2, default=str), encoding="utf-8"
-        )
+        write_json(output_path / "PACKAGE_MANIFEST.json", manifest)
 
-        self.state.completed_at = datetime.now().isoformat()
+        self.state.completed_at = finished_at
         self.state.total_tokens_used = cost_summary["total_tokens"]
         self.state.estimated_cost_usd = cost_summary["estimated_cost_usd"]
 
-        audio_count = len([f for f in output_path.rglob("*") if f.suffix in (".mp3", ".wav")])
-
+        state = self.state
         console.print(Panel(
             f"[bold green]✅ Pipeline Complete[/bold green]\n\n"
-            f"📁 Output: {self.state.output_dir}\n"
-            f"📄 PDFs: {len(self.state.pdf_files)}\n"
+            f"📁 Output: {state.output_dir}\n"
+            f"📄 PDFs: {len(state.pdf_files)}\n"
             f"🖼️ Images: {image_count}\n"
             f"🔊 Audio: {audio_count}\n"
-            f"🎮 Prototype: {'Yes' if self.state.prototype_path else 'No'}\n"
+            f"🎮 Prototype: {'Yes' if state.prototype_path else 'No'}\n"
             f"📊 Files: {len(all_files)}\n"
             f"💰 Est. Cost: ${cost_summary['estimated_cost_usd']:.2f}\n"
-            f"⏱️ {self.state.started_at} → {self.state.completed_at}",
+            f"⏱️ {state.started_at} → {finished_at}",
             title="🎰 Package Complete", border_style="green",
         ))
 
         # ---- Save to Knowledge Base (UPGRADE 4) ----
         try:
-            from tools.advanced_research import KnowledgeBaseTool
-            kb = KnowledgeBaseTool()
+            kb = get_tool("knowledge_base")
             game_data = {
-                "theme": self.state.game_idea.theme,
-                "target_markets": self.state.game_idea.target_markets,
-                "volatility": self.state.game_idea.volatility.value,
-                "target_rtp": self.state.game_idea.target_rtp,
-                "grid": f"{self.state.game_idea.grid_cols}x{self.state.game_idea.grid_rows}",
-                "ways_or_lines": self.state.game_idea.ways_or_lines,
-                "max_win": self.state.game_idea.max_win_multiplier,
-                "art_style": self.state.game_idea.art_style,
-                "features": [f.value for f in self.state.game_idea.requested_features],
-                "gdd_summary": str(self.state.gdd.get("output", ""))[:2000] if self.state.gdd else "",
-                "math_summary": str(self.state.math_model.get("output", ""))[:1000] if self.state.math_model else "",
-                "compliance_summary": str(self.state.compliance.get("output", ""))[:1000] if self.state.compliance else "",
+                "theme": idea["theme"],
+                "target_markets": idea["target_markets"],
+                "volatility": idea["volatility"],
+                "target_rtp": idea["target_rtp"],
+                "grid": f"{idea['grid_cols']}x{idea['grid_rows']}",
+                "ways_or_lines": idea["ways_or_lines"],
+                "max_win": idea["max_win_multiplier"],
+                "art_style": idea["art_style"],
+                "features": idea["requested_features"],
+                "gdd_summary": self._context("gdd", 2000),
+                "math_summary": self._context("math", 1000),
+                "compliance_summary": self._context("compliance", 1000),
                 "cost_usd": cost_summary['estimated_cost_usd'],
                 "completed_at": self.state.completed_at,
             }
-            kb._run(action="save", game_slug=self.state.game_slug, game_data=json.dumps(game_data))
+            kb._run(action="save", game_slug=self.state.game_slug, game_data=dumps_bytes(game_data, indent=False).decode("utf-8"))
             console.print("[green]🧠 Saved to knowledge base for future reference[/green]")
         except Exception as e:
             console.print(f"[yellow]⚠️ Knowledge base save failed (non-fatal): {e}[/yellow]")
@@ -1002,36 +1319,99 @@ class SlotStudioFlow(Flow[PipelineState]):
     # Adversarial Review Helper (UPGRADE 5)
     # ============================================================
 
-    def _run_adversarial_review(self, stage: str, context_summary: str):
-        """Run the adversarial reviewer agent on the current stage's output."""
-        try:
-            from agents.adversarial_reviewer import build_review_task_description
-            console.print(f"\n[bold red]🔴 Adversarial Review: {stage}[/bold red]\n")
+    def _build_review_crew(self, stage: str, context_summary: str) -> Crew:
+        """Build the adversarial review crew for one stage."""
+        if PipelineConfig.REVIEW_FANOUT:
+            return self._build_fanout_review_crew(stage, context_summary)
 
-            review_desc = build_review_task_description(
-                stage=stage,
-                context_summary=context_summary,
-                output_dir=self.state.output_dir,
-            )
+        review_desc = build_review_task_description(
+            stage=stage,
+            context_summary=context_summary,
+            output_dir=self.state.output_dir,
+        )
 
-            review_task = Task(
-                description=review_desc,
-                expected_output=f"Structured adversarial critique saved to {self.state.output_dir}/adversarial_review_{stage}.md",
-                agent=self.agents["adversarial_reviewer"],
-            )
+        review_task = Task(
+            description=review_desc,
+            expected_output=f"Structured adversarial critique saved to {self._review_path(stage)}",
+            agent=self.agents["adversarial_reviewer"],
+        )
 
-            crew = Crew(
-                agents=[self.agents["adversarial_reviewer"]],
-                tasks=[review_task],
-                process=Process.sequential, verbose=True,
+        return Crew(
+            agents=[self.agents["adversarial_reviewer"]],
+            tasks=[review_task],
+            process=Process.sequential, verbose=PipelineConfig.REVIEW_VERBOSE,
+        )
+
+    def _build_fanout_review_crew(self, stage: str, context_summary: str) -> Crew:
+        """
+        Section analysts draft the critique sections concurrently (async tasks),
+        then the lead reviewer merges them and writes the verdict. Each
+        section gets its own analyst: an Agent can't run two tasks at once.
+        """
+        section_agents = [create_section_reviewer() for _ in REVIEW_SECTIONS]
+        section_tasks = [
+            Task(
+                description=build_section_task_description(stage, section, context_summary),
+                expected_output=f"Draft of the '{heading}' section",
+                agent=agent,
+                async_execution=True,
             )
-            result = crew.kickoff()
+            for agent, (section, (heading, _)) in zip(section_agents, REVIEW_SECTIONS.items())
+        ]
+        merge_task = Task(
+            description=build_aggregate_task_description(stage, self.state.output_dir),
+            expected_output=f"Structured adversarial critique saved to {self._review_path(stage)}",
+            agent=self.agents["adversarial_reviewer"],
+            context=section_tasks,
+        )
+
+        return Crew(
+            agents=[*section_agents, self.agents["adversarial_reviewer"]],
+            tasks=[*section_tasks, merge_task],
+            process=Process.sequential, verbose=PipelineConfig.REVIEW_VERBOSE,
+        )
+
+    def _review_path(self, stage: str) -> Path:
+        """output_dir/adversarial_review_<stage>.md, built once per stage."""
+        path = self._review_paths.get(stage)
+        if path is None:
+            path = self._review_paths[stage] = self.output_path / f"adversarial_review_{stage}.md"
+        return path
 
-            # Ensure the review is saved
-            review_path = Path(self.state.output_dir, f"adversarial_review_{stage}.md")
-            if not review_path.exists():
-                review_path.write_text(str(result), encoding="utf-8")
+    def _save_review(self, stage: str, result) -> Path:
+        """Ensure the review is on disk even if the agent didn't write it."""
+        review_path = self._review_path(stage)
+        try:
+            # "x" creates the file only if the agent didn't: no separate exists() stat
+            with open(review_path, "xb") as f:
+                f.write(str(result).encode("utf-8"))
+        except FileExistsError:
+            pass
+        return review_path
 
+    def _run_adversarial_review(self, stage: str, context_summary: str):
+        """Run the adversarial reviewer agent on the current stage's output."""
+        try:
+            console.print(f"\n[bold red]🔴 Adversarial Review: {stage}[/bold red]\n")
+            result = self._build_review_crew(stage, context_summary).kickoff()
+            review_path = self._save_review(stage, result)
             console.print(f"[green]✅ Adversarial review complete: {review_path.name}[/green]")
         except Exception as e:
             console.print(f"[yellow]⚠️ Adversarial review failed (non-fatal): {e}[/yellow]")
+
+    def _start_review(self, stage: str, context_summary: str):
+        """
+        Start a stage's adversarial review in the background as soon as its
+        output exists, so it runs while the stage finishes writing files
+        and the flow moves on to the checkpoint. The copied context keeps
+        the review inside this run's tool_run_cache.
+        """
+        ctx = contextvars.copy_context()
+        self._pending_reviews[stage] = self._review_runner.submit(
+            ctx.run, self._run_adversarial_review, stage, context_summary)
+
+    async def _await_review(self, stage: str):
+        """Wait for a review started by _start_review (no-op if none was started)."""
+        future = self._pending_reviews.pop(stage, None)
+        if future is not None:
+            await asyncio.wrap_future(future)
@@ -17,24 +17,26 @@ Usage:
     python -m flows.state_recon --state "North Carolina" --auto  # skip HITL
 """
 
+import contextvars
+import hashlib
 import json
 import os
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from crewai import Agent, Crew, Process, Task
 from crewai.flow.flow import Flow, listen, start
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
 
-from config.settings import LLMConfig
-from tools.legal_research_tool import LegalResearchTool, StatuteFetchTool
-from tools.custom_tools import RegulatoryRAGTool, FileWriterTool
-from tools.advanced_research import WebFetchTool, DeepResearchTool
+from config.settings import BASE_DIR, LLMConfig, PipelineConfig
+from tools.json_io import dumps_bytes, loads
+from tools.registry import get_tool, tool_run_cache
 
 console = Console()
 
@@ -99,26 +101,423 @@ class ReconState(BaseModel):
     hitl_approvals: dict[str, bool] = Field(default_factory=dict)
     auto_mode: bool = False
 
+    # {field: (serialized value, its JSON)}; see _state_json/_prompt_json. Not serialized.
+    _json_cache: dict = PrivateAttr(default_factory=dict)
+
 
 # ============================================================
-# Agent Factory
+# Stage 1 research passes: (search_pass, heading, what to look for)
 # ============================================================
 
-def create_recon_agents() -> dict[str, Agent]:
-    """Build the 4 recon agents with appropriate tools.
-    UPGRADED: Deep research + web fetch for maximum legal research depth."""
+_RESEARCH_PASSES = (
+    ("statutes", "STATUTES",
+     "Find the state's core gambling statutes and penal code sections."),
+    ("definitions", "DEFINITIONS",
+     "Find how the state legally defines 'gambling', 'game of chance',\n"
+     "'consideration', 'prize', and 'skill game'."),
+    ("exemptions", "EXEMPTIONS",
+     "Find ALL exemptions — skill games, amusement devices, sweepstakes,\n"
+     "social gambling, fraternal/charitable orgs, promotional contests."),
+    ("case_law", "CASE LAW",
+     "Find court rulings on skill vs chance and device classifications."),
+    ("enforcement", "ENFORCEMENT",
+     "Find recent enforcement actions, DA posture, seizures."),
+    ("legislation", "LEGISLATION",
+     "Find pending bills that might change the landscape."),
+)
 
-    legal_search = LegalResearchTool()
-    statute_fetch = StatuteFetchTool()
-    reg_rag = RegulatoryRAGTool()
-    file_writer = FileWriterTool()
-    web_fetch = WebFetchTool()
-    deep_research = DeepResearchTool()
 
-    agents = {}
+# ============================================================
+# Stage output schemas (the JSON each stage's agent is asked for)
+# ============================================================
 
-    # ---- 1. Legal Recon Agent (UPGRADED: deep research + web fetch) ----
-    agents["legal_recon"] = Agent(
+_RESEARCH_SCHEMA = """\
+{
+    "state": "...",
+    "primary_gambling_statute": {
+        "citation": "...",
+        "url": "...",
+        "key_text": "..."
+    },
+    "additional_statutes": [...],
+    "definitions_found": {
+        "gambling": "exact statutory text...",
+        "lottery": "...",
+        "game_of_chance": "...",
+        "consideration": "...",
+        "prize": "...",
+        "skill_game": "... (if defined)"
+    },
+    "exemptions_found": [
+        {
+            "name": "...",
+            "statutory_basis": "...",
+            "requirements": "...",
+            "key_text": "..."
+        }
+    ],
+    "court_rulings": [
+        {
+            "case_name": "...",
+            "year": "...",
+            "holding": "...",
+            "relevance": "..."
+        }
+    ],
+    "ag_opinions": [...],
+    "enforcement_posture": "aggressive|moderate|lax|unknown",
+    "enforcement_examples": [...],
+    "pending_legislation": [...],
+    "key_sources": [
+        {
+            "url": "...",
+            "title": "...",
+            "reliability": "OFFICIAL|LEGAL_DB|INDUSTRY|GENERAL"
+        }
+    ]
+}"""
+
+
+_PROFILE_SCHEMA = """\
+{
+    "state": "...",
+    "gambling_definition": {
+        "citation": "...",
+        "elements": ["consideration", "chance", "prize"],
+        "chance_test": "predominance|any_chance|material_element|gambling_instinct",
+        "chance_test_source": "statute|case_law|ag_opinion",
+        "key_language": "exact statutory text..."
+    },
+    "element_negation_map": {
+        "chance": {
+            "can_negate": true/false,
+            "strategy": "...",
+            "minimum_skill_required": "...",
+            "legal_basis": "..."
+        },
+        "consideration": {
+            "can_negate": true/false,
+            "strategy": "...",
+            "legal_basis": "..."
+        },
+        "prize": {
+            "can_negate": true/false,
+            "strategy": "...",
+            "max_prize": "...",
+            "legal_basis": "..."
+        }
+    },
+    "exemptions": [
+        {
+            "name": "...",
+            "statutory_basis": "...",
+            "requirements": [...],
+            "prize_limits": "...",
+            "location_requirements": "...",
+            "strength": "STRONG|MODERATE|WEAK|UNTESTED",
+            "game_design_constraints": [...]
+        }
+    ],
+    "court_rulings_analysis": [
+        {
+            "case": "...",
+            "holding": "...",
+            "impact_on_game_design": "..."
+        }
+    ],
+    "enforcement_profile": {
+        "posture": "aggressive|moderate|lax",
+        "primary_enforcer": "AG|DA|gaming_commission|police",
+        "recent_actions": [...],
+        "prosecution_targets": "..."
+    },
+    "risk_tier": "DEPLOY_NOW|STRUCTURED_DEPLOY|GRAY_AREA|HIGH_RISK|DO_NOT_ENTER",
+    "legal_pathways_ranked": [
+        {
+            "pathway": "skill_game|amusement_device|sweepstakes|regulated|vlt|other",
+            "viability": "HIGH|MEDIUM|LOW",
+            "legal_theory": "...",
+            "key_risks": [...]
+        }
+    ],
+    "red_flags": [...],
+    "pending_changes": [...]
+}"""
+
+
+_ARCHITECTURE_SCHEMA = """\
+{
+    "state": "...",
+    "legal_pathway": "...",
+    "legal_classification": "skill_game|amusement_device|sweepstakes|vlt|other",
+
+    "game_concept": {
+        "name": "...",
+        "description": "...",
+        "player_experience": "..."
+    },
+
+    "core_mechanics": {
+        "base_game": {
+            "type": "reel_spin|card_draw|puzzle|other",
+            "grid": "5x3 or similar",
+            "description": "..."
+        },
+        "skill_elements": [
+            {
+                "mechanic": "...",
+                "player_action": "exact description of what player does",
+                "outcome_effect": "exactly how this affects the result",
+                "skill_advantage": "percentage advantage for skilled player",
+                "legal_justification": "maps to which statute/exemption",
+                "implementation_spec": "developer-level detail"
+            }
+        ],
+        "rng_elements": {
+            "what_is_random": "...",
+            "what_is_player_controlled": "...",
+            "chance_skill_ratio": "estimated percentage"
+        }
+    },
+
+    "prize_structure": {
+        "form": "cash|gift_card|merchandise|credits|other",
+        "max_single_prize": "...",
+        "payout_mechanism": "...",
+        "statutory_basis": "...",
+        "prohibited_prize_types": [...]
+    },
+
+    "rtp_design": {
+        "unskilled_rtp": "...",
+        "skilled_rtp": "...",
+        "theoretical_max": "...",
+        "house_edge": "..."
+    },
+
+    "prohibited_features": [
+        {
+            "feature": "...",
+            "reason": "would trigger [statute] because..."
+        }
+    ],
+
+    "game_flow": [
+        {
+            "step": 1,
+            "action": "...",
+            "legal_note": "satisfies [requirement] because..."
+        }
+    ],
+
+    "hardware_requirements": {
+        "payment_acceptance": "...",
+        "display": "...",
+        "input_devices": "...",
+        "special_requirements": "..."
+    },
+
+    "operational_requirements": {
+        "location_types": [...],
+        "licensing": "...",
+        "age_verification": "...",
+        "signage": "...",
+        "record_keeping": "...",
+        "tax_reporting": "..."
+    }
+}"""
+
+
+_BRIEF_SCHEMA = """\
+{
+    "state": "...",
+    "brief_date": "...",
+    "disclaimer": "FOR RESEARCH PURPOSES ONLY — NOT LEGAL ADVICE. Requires review by licensed attorney.",
+
+    "executive_summary": "...",
+
+    "statutory_framework": [
+        {
+            "citation": "...",
+            "title": "...",
+            "relevance": "...",
+            "key_language": "..."
+        }
+    ],
+
+    "legal_theory": "...",
+
+    "element_by_element_defense": [
+        {
+            "element": "chance|consideration|prize",
+            "statutory_basis": "...",
+            "game_design_negation": "...",
+            "prosecution_argument": "...",
+            "rebuttal": "...",
+            "supporting_case_law": "...",
+            "strength": "STRONG|MODERATE|WEAK"
+        }
+    ],
+
+    "exemption_defense": {
+        "exemption_name": "...",
+        "statutory_basis": "...",
+        "requirement_mapping": [
+            {
+                "requirement": "...",
+                "game_feature": "...",
+                "compliance_evidence": "..."
+            }
+        ]
+    },
+
+    "supporting_case_law": [
+        {
+            "case": "...",
+            "holding": "...",
+            "application": "..."
+        }
+    ],
+
+    "risk_matrix": {
+        "prosecution_probability": "LOW|MEDIUM|HIGH",
+        "conviction_probability_if_prosecuted": "LOW|MEDIUM|HIGH",
+        "penalty_severity": "...",
+        "mitigating_factors": [...],
+        "aggravating_factors": [...]
+    },
+
+    "prosecutions_best_case": {
+        "argument": "...",
+        "why_it_fails": "..."
+    },
+
+    "recommended_precautions": [...],
+
+    "expert_witnesses": [
+        {
+            "type": "...",
+            "purpose": "..."
+        }
+    ],
+
+    "legislative_watchlist": [...],
+
+    "overall_assessment": "..."
+}"""
+
+
+# ============================================================
+# What later stages see of each stage result
+# ============================================================
+
+# Top-level keys of each stage's JSON that later stages' prompts carry.
+# Whole keys instead of a character slice: no half-cut JSON, and no tokens
+# spent on echoed state names, source URL lists or hardware specs.
+_PROMPT_KEYS = {
+    "raw_research": (
+        "primary_gambling_statute", "additional_statutes", "definitions_found",
+        "exemptions_found", "court_rulings", "ag_opinions", "enforcement_posture",
+        "enforcement_examples", "pending_legislation",
+    ),
+    "legal_profile": (
+        "gambling_definition", "element_negation_map", "exemptions",
+        "court_rulings_analysis", "enforcement_profile", "risk_tier",
+        "legal_pathways_ranked", "red_flags",
+    ),
+    "game_architecture": (
+        "legal_pathway", "legal_classification", "game_concept", "core_mechanics",
+        "prize_structure", "rtp_design", "prohibited_features", "game_flow",
+        "operational_requirements",
+    ),
+}
+
+# Cap for a result that never parsed as JSON ({"raw_text": ...}), which has
+# none of the keys above
+_RAW_PROMPT_CHARS = 12000
+
+
+# ============================================================
+# Agent output parsing
+# ============================================================
+
+_json_decoder = json.JSONDecoder()
+
+
+def _state_json(state: ReconState, field: str) -> bytes:
+    """Indented JSON (UTF-8 bytes, via json_io) of a stage result as written
+    to the stage's file, serialized once. _set_result may have primed it
+    with the agent's own text."""
+    value = getattr(state, field)
+    cached = state._json_cache.get(field)
+    if cached is None or cached[0] is not value:
+        cached = state._json_cache[field] = (value, dumps_bytes(value))
+    return cached[1]
+
+
+def _prompt_json(state: ReconState, field: str) -> str:
+    """Compact JSON of the _PROMPT_KEYS slice of a stage result, for later
+    stages' prompts (indentation is tokens the model doesn't need). Cached
+    alongside _state_json."""
+    value = getattr(state, field)
+    key = f"{field}:prompt"
+    cached = state._json_cache.get(key)
+    if cached is None or cached[0] is not value:
+        slim = {k: value[k] for k in _PROMPT_KEYS[field] if k in value}
+        text = dumps_bytes(slim or value, indent=False).decode("utf-8")
+        if not slim:
+            text = text[:_RAW_PROMPT_CHARS]
+        cached = state._json_cache[key] = (value, text)
+    return cached[1]
+
+
+def _parse_agent_json(raw: str) -> tuple[dict, bool]:
+    """Parse an agent's JSON answer, digging it out of surrounding prose if needed.
+    Anything that isn't a JSON object becomes {"raw_text": raw}, so stage
+    results are always dicts and callers can .get() without type checks.
+    The flag is True when raw itself was exactly that JSON object.
+
+    Mixed output is decoded from each '{' in turn with raw_decode, which
+    stops at the end of the first complete object: braces inside strings,
+    a stray '{' in the prose before the JSON, or notes after it don't
+    break the parse the way a first-'{'-to-last-'}' regex span did.
+    """
+    try:
+        parsed = loads(raw)
+    except ValueError:
+        pass
+    else:
+        if isinstance(parsed, dict):
+            return parsed, True
+        return {"raw_text": raw}, False
+    start = raw.find("{")
+    while start != -1:
+        try:
+            return _json_decoder.raw_decode(raw, start)[0], False
+        except json.JSONDecodeError:
+            start = raw.find("{", start + 1)
+    return {"raw_text": raw}, False
+
+
+def _set_result(state: ReconState, field: str, raw: str):
+    """Store a stage's parsed answer on state. When the agent replied with
+    bare JSON, that text is kept as the stage file's contents (_state_json)
+    rather than re-serialized from the dict it just parsed to."""
+    value, exact = _parse_agent_json(raw)
+    setattr(state, field, value)
+    if exact:
+        state._json_cache[field] = (getattr(state, field), raw.strip().encode("utf-8"))
+
+
+# ============================================================
+# Agent Factory
+# ============================================================
+
+def create_legal_recon_agent() -> Agent:
+    """The stage 1 researcher. Called once per research pass as well as by
+    create_recon_agents: an Agent holds its executor and iteration state
+    while it runs a task, so concurrent passes each need their own."""
+    return Agent(
         role="State Gaming Law Researcher",
         goal=(
             "Conduct exhaustive legal research on a target state's gambling laws. "
@@ -141,10 +540,30 @@ def create_recon_agents() -> dict[str, Agent]:
         ),
         llm=LLMConfig.get_llm("compliance_officer"),
         max_iter=20,  # More iterations for deep multi-pass research
-        verbose=True,
-        tools=[deep_research, web_fetch, legal_search, statute_fetch, reg_rag],
+        verbose=PipelineConfig.RECON_VERBOSE,
+        tools=[
+            get_tool("deep_research"), get_tool("web_fetch"), get_tool("legal_search"),
+            get_tool("statute_fetch"), get_tool("reg_rag"),
+        ],
     )
 
+
+def create_recon_agents() -> dict[str, Agent]:
+    """Build the 4 recon agents with appropriate tools.
+    UPGRADED: Deep research + web fetch for maximum legal research depth."""
+
+    # Shared instances from the registry: built once per process, so
+    # repeated recon runs (one per state in a sweep) reuse them
+    reg_rag = get_tool("reg_rag")
+    file_writer = get_tool("file_writer")
+    web_fetch = get_tool("web_fetch")
+    deep_research = get_tool("deep_research")
+
+    agents = {}
+
+    # ---- 1. Legal Recon Agent (UPGRADED: deep research + web fetch) ----
+    agents["legal_recon"] = create_legal_recon_agent()
+
     # ---- 2. Definition Analyzer Agent (UPGRADED: web fetch for full statute text) ----
     agents["definition_analyzer"] = Agent(
         role="Legal Definition Analyst & Loophole Mapper",
@@ -164,7 +583,7 @@ def create_recon_agents() -> dict[str, Agent]:
         ),
         llm=LLMConfig.get_llm("compliance_officer"),
         max_iter=8,
-        verbose=True,
+        verbose=PipelineConfig.RECON_VERBOSE,
         tools=[web_fetch, reg_rag, file_writer],
     )
 
@@ -191,7 +610,7 @@ def create_recon_agents() -> dict[str, Agent]:
         ),
         llm=LLMConfig.get_llm("game_designer"),  # TIER 1
         max_iter=5,
-        verbose=True,
+        verbose=PipelineConfig.RECON_VERBOSE,
         tools=[file_writer],
     )
 
@@ -214,7 +633,7 @@ def create_recon_agents() -> dict[str, Agent]:
         ),
         llm=LLMConfig.get_llm("compliance_officer"),
         max_iter=10,
-        verbose=True,
+        verbose=PipelineConfig.RECON_VERBOSE,
         tools=[deep_research, web_fetch, reg_rag, file_writer],
     )
 
@@ -232,6 +651,9 @@ def recon_hitl(name: str, summary: str, state: ReconState) -> bool:
         state.hitl_approvals[name] = True
         return True
 
+    # Only interactive runs prompt; auto-mode workers never import rich.prompt
+    from rich.prompt import Confirm, Prompt
+
     console.print(Panel(summary, title=f"🔍 RECON CHECKPOINT: {name}", border_style="cyan"))
     approved = Confirm.ask("[bold cyan]Approve and proceed?[/bold cyan]", default=True)
     state.hitl_approvals[name] = approved
@@ -250,6 +672,34 @@ def recon_hitl(name: str, summary: str, state: ReconState) -> bool:
 # State Recon Flow
 # ============================================================
 
+# Stage LLM outputs keyed by prompt hash; see StateReconFlow._kickoff
+_CACHE_DIR = BASE_DIR / "cache" / "recon"
+
+
+def _crew_cache_key(crew: Crew) -> str:
+    """Hash of everything that shapes a crew's answer: each task's prompt,
+    agent role and model."""
+    h = hashlib.blake2b(digest_size=16)
+    for task in crew.tasks:
+        model = getattr(task.agent.llm, "model", task.agent.llm)
+        for part in (task.description, task.agent.role, str(model)):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+    return h.hexdigest()
+
+
+def _prune_cache():
+    """Delete cached stage outputs older than RECON_CACHE_TTL_H."""
+    cutoff = time.time() - PipelineConfig.RECON_CACHE_TTL_H * 3600
+    try:
+        with os.scandir(_CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+    except OSError:
+        pass  # no cache dir yet, or an entry vanished mid-scan
+
+
 class StateReconFlow(Flow[ReconState]):
     """
     Autonomous pipeline: point at any US state → get a legally defensible
@@ -262,10 +712,110 @@ class StateReconFlow(Flow[ReconState]):
     4. Defense Brief Generation (statutory mapping + risk assessment)
     """
 
-    def __init__(self, auto_mode: bool = False):
-        super().__init__()
-        self.agents = create_recon_agents()
-        self.auto_mode = auto_mode
+    def __init__(self, auto_mode: bool = False, use_cache: bool = False):
+        super().__init__()
+        self.agents = create_recon_agents()
+        self.auto_mode = auto_mode
+        self.use_cache = use_cache and PipelineConfig.RECON_CACHE_TTL_H > 0
+        if self.use_cache:
+            _prune_cache()
+        self._pending_writes: list[Future] = []
+        self._writer: Optional[ThreadPoolExecutor] = None  # this run's artifact writer; see kickoff
+        self._ingest: Optional[Future] = None
+        self.output_path: Optional[Path] = None  # set by initialize()
+
+    def kickoff(self, *args, **kwargs):
+        # Stage artifacts are written off the flow's thread by this run's
+        # own writer; see _write_artifact
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recon-writer")
+        try:
+            # The research passes and later stages share legal_search and
+            # statute_fetch; dedupe identical calls for this run
+            with tool_run_cache():
+                return super().kickoff(*args, **kwargs)
+        finally:
+            # A finished run has flushed already; an aborted one still lands
+            # what it queued and reports a failed write instead of losing it
+            try:
+                self._flush_writes()
+            except OSError as e:
+                console.print(f"[yellow]⚠ Could not write a stage artifact: {e}[/yellow]")
+            self._writer.shutdown(wait=False)
+
+    def _kickoff(self, crew: Crew) -> str:
+        """
+        Run a stage crew and return its raw output. With the cache on
+        (opt-in), a crew whose prompts, roles and models match a run from
+        the last RECON_CACHE_TTL_H hours returns that run's output instead.
+        Re-running a state whose earlier stages haven't changed skips their
+        LLM calls. Only answers that parsed as JSON are cached, so a failed
+        or garbled run is never replayed.
+        """
+        path = None
+        if self.use_cache:
+            path = _CACHE_DIR / f"{_crew_cache_key(crew)}.txt"
+            try:
+                age_h = (time.time() - path.stat().st_mtime) / 3600
+                if age_h < PipelineConfig.RECON_CACHE_TTL_H:
+                    console.print(f"[dim]Reusing cached stage output ({age_h:.1f}h old): {path}[/dim]")
+                    return path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                pass
+
+        result = crew.kickoff()
+        raw = result.raw if hasattr(result, "raw") else str(result)
+
+        # _parse_agent_json's fallback wraps the very string it couldn't parse
+        if path is not None and _parse_agent_json(raw)[0].get("raw_text") is not raw:
+            try:
+                _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                path.write_text(raw, encoding="utf-8")
+            except OSError as e:
+                console.print(f"[yellow]⚠ Could not cache stage output: {e}[/yellow]")
+        return raw
+
+    def _write_artifact(self, path: Path, data: bytes):
+        """Queue a stage artifact write so the next stage's crew can start
+        while it lands on disk. _flush_writes() waits for all of them."""
+        self._pending_writes.append(self._writer.submit(path.write_bytes, data))
+
+    def _flush_writes(self):
+        """Wait for queued artifact writes; re-raises the first write error."""
+        pending, self._pending_writes = self._pending_writes, []
+        wait(pending)
+        for future in pending:
+            future.result()
+
+    def _auto_ingest(self, output_dir: str):
+        """
+        Ingest a finished recon package into Qdrant. Runs in the background
+        after recon_package.json is written, so the outcome goes to its own
+        ingest_status.json instead of the flow state.
+        """
+        status = {"ingested": False, "error": None}
+        try:
+            from tools.auto_ingest import ingest_recon_result
+            ingest_result = ingest_recon_result(output_dir, embed=True)
+            if ingest_result:
+                console.print(f"[green]✓ Ingested into Qdrant: {ingest_result.get('state', 'unknown')}[/green]")
+                console.print(f"[green]  RAG doc: {ingest_result.get('rag_path', 'N/A')}[/green]")
+            else:
+                console.print("[yellow]⚠ Ingest returned no result (Qdrant may not be configured)[/yellow]")
+            status["ingested"] = bool(ingest_result)
+        except Exception as e:
+            console.print(f"[yellow]⚠ Auto-ingest failed: {e}[/yellow]")
+            console.print(f"[yellow]  Run manually: python -m tools.auto_ingest {output_dir} --embed[/yellow]")
+            status["error"] = str(e)
+        status["finished_at"] = datetime.now().isoformat(timespec="seconds")
+        try:
+            (Path(output_dir) / "ingest_status.json").write_bytes(dumps_bytes(status))
+        except OSError as e:
+            console.print(f"[yellow]⚠ Could not write ingest status: {e}[/yellow]")
+
+    def wait_ingest(self, timeout: Optional[float] = None):
+        """Block until the background Qdrant ingest (if any) has finished."""
+        if self._ingest is not None:
+            wait([self._ingest], timeout=timeout)
 
     # ────────────────────────────────────────
     # STAGE 0: Initialize
@@ -276,11 +826,13 @@ class StateReconFlow(Flow[ReconState]):
         """Set up output directory and validate input."""
         state = self.state
         state.auto_mode = self.auto_mode
-        state.started_at = datetime.now().isoformat()
+        state.started_at = datetime.now().isoformat(timespec="seconds")
+        self._started = time.monotonic()
 
         slug = state.target_state.lower().replace(" ", "_")
-        state.output_dir = str(Path("output") / "recon" / slug)
-        Path(state.output_dir).mkdir(parents=True, exist_ok=True)
+        self.output_path = Path("output") / "recon" / slug
+        state.output_dir = str(self.output_path)
+        self.output_path.mkdir(parents=True, exist_ok=True)
 
         console.print(Panel(
             f"[bold green]STATE RECON: {state.target_state}[/bold green]\n"
@@ -301,82 +853,39 @@ class StateReconFlow(Flow[ReconState]):
         state = self.state
         console.print("\n[bold blue]═══ STAGE 1: LEGAL RESEARCH ═══[/bold blue]\n")
 
+        # The six search passes don't depend on each other, so they run
+        # side by side (at most RECON_PASS_WORKERS at once, to go easy on
+        # the LLM rate limit), each on its own agent. The synthesis task
+        # then merges their findings.
+        with ThreadPoolExecutor(max_workers=PipelineConfig.RECON_PASS_WORKERS,
+                                thread_name_prefix="recon-pass") as pool:
+            futures = [
+                # Each pass runs in a copy of this run's context, so it sees
+                # the tool_run_cache that kickoff() opened
+                pool.submit(contextvars.copy_context().run, self._research_pass, *research_pass)
+                for research_pass in _RESEARCH_PASSES
+            ]
+            findings = "\n\n".join(
+                f"=== {heading} ===\n{future.result()}"
+                for (_, heading, _), future in zip(_RESEARCH_PASSES, futures)
+            )
+
         task = Task(
             description=f"""
-Conduct comprehensive legal research on {state.target_state}'s gambling laws.
-
-Execute the following research passes using the legal_research tool:
-
-1. STATUTES: Search for the state's core gambling statutes and penal code sections.
-   Use search_pass='statutes' with state='{state.target_state}'
-
-2. DEFINITIONS: Search for how the state legally defines 'gambling', 'game of chance',
-   'consideration', 'prize', and 'skill game'.
-   Use search_pass='definitions'
-
-3. EXEMPTIONS: Search for ALL exemptions — skill games, amusement devices, sweepstakes,
-   social gambling, fraternal/charitable orgs, promotional contests.
-   Use search_pass='exemptions'
+Combine the six research passes on {state.target_state}'s gambling laws
+(statutes, definitions, exemptions, case law, enforcement, legislation) into one
+comprehensive legal research profile.
 
-4. CASE LAW: Search for court rulings on skill vs chance, device classifications.
-   Use search_pass='case_law'
+RESEARCH PASS FINDINGS:
+{findings}
 
-5. ENFORCEMENT: Search for recent enforcement actions, DA posture, seizures.
-   Use search_pass='enforcement'
-
-6. LEGISLATION: Search for pending bills that might change the landscape.
-   Use search_pass='legislation'
-
-After searching, use the fetch_statute tool to retrieve the FULL TEXT of the most
-important statutes and court opinions you find (at least 2-3 key sources).
+Use the fetch_statute tool to retrieve the FULL TEXT of the most important
+statutes and court opinions the passes found (at least 2-3 key sources).
 
 Also check the search_regulations tool for any existing data on {state.target_state}.
 
 OUTPUT FORMAT (JSON):
-{{
-    "state": "{state.target_state}",
-    "primary_gambling_statute": {{
-        "citation": "...",
-        "url": "...",
-        "key_text": "..."
-    }},
-    "additional_statutes": [...],
-    "definitions_found": {{
-        "gambling": "exact statutory text...",
-        "lottery": "...",
-        "game_of_chance": "...",
-        "consideration": "...",
-        "prize": "...",
-        "skill_game": "... (if defined)"
-    }},
-    "exemptions_found": [
-        {{
-            "name": "...",
-            "statutory_basis": "...",
-            "requirements": "...",
-            "key_text": "..."
-        }}
-    ],
-    "court_rulings": [
-        {{
-            "case_name": "...",
-            "year": "...",
-            "holding": "...",
-            "relevance": "..."
-        }}
-    ],
-    "ag_opinions": [...],
-    "enforcement_posture": "aggressive|moderate|lax|unknown",
-    "enforcement_examples": [...],
-    "pending_legislation": [...],
-    "key_sources": [
-        {{
-            "url": "...",
-            "title": "...",
-            "reliability": "OFFICIAL|LEGAL_DB|INDUSTRY|GENERAL"
-        }}
-    ]
-}}
+{_RESEARCH_SCHEMA}
 """,
             expected_output="Comprehensive JSON legal research profile",
             agent=self.agents["legal_recon"],
@@ -386,46 +895,54 @@ OUTPUT FORMAT (JSON):
             agents=[self.agents["legal_recon"]],
             tasks=[task],
             process=Process.sequential,
-            verbose=True,
+            verbose=PipelineConfig.RECON_VERBOSE,
         )
 
-        result = crew.kickoff()
-        raw = result.raw if hasattr(result, "raw") else str(result)
+        raw = self._kickoff(crew)
 
-        # Try to parse as JSON
-        try:
-            state.raw_research = json.loads(raw)
-        except json.JSONDecodeError:
-            # Try to extract JSON from mixed output
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', raw)
-            if json_match:
-                try:
-                    state.raw_research = json.loads(json_match.group())
-                except json.JSONDecodeError:
-                    state.raw_research = {"raw_text": raw}
-            else:
-                state.raw_research = {"raw_text": raw}
+        _set_result(state, "raw_research", raw)
 
         # Save raw research
-        research_path = Path(state.output_dir) / "01_raw_research.json"
-        research_path.write_text(json.dumps(state.raw_research, indent=2, default=str), encoding="utf-8")
+        research_path = self.output_path / "01_raw_research.json"
+        self._write_artifact(research_path, _state_json(state, "raw_research"))
         console.print(f"[green]✓ Research saved: {research_path}[/green]")
 
         # HITL checkpoint
-        summary = f"Research for {state.target_state}:\n"
-        if isinstance(state.raw_research, dict):
-            defs = state.raw_research.get("definitions_found", {})
-            exemptions = state.raw_research.get("exemptions_found", [])
-            rulings = state.raw_research.get("court_rulings", [])
-            summary += f"• Definitions found: {len(defs)}\n"
-            summary += f"• Exemptions found: {len(exemptions)}\n"
-            summary += f"• Court rulings found: {len(rulings)}\n"
-            summary += f"• Enforcement posture: {state.raw_research.get('enforcement_posture', 'unknown')}\n"
+        research = state.raw_research
+        summary = (
+            f"Research for {state.target_state}:\n"
+            f"• Definitions found: {len(research.get('definitions_found', {}))}\n"
+            f"• Exemptions found: {len(research.get('exemptions_found', []))}\n"
+            f"• Court rulings found: {len(research.get('court_rulings', []))}\n"
+            f"• Enforcement posture: {research.get('enforcement_posture', 'unknown')}\n"
+        )
 
         recon_hitl("Legal Research", summary, state)
         return state
 
+    def _research_pass(self, search_pass: str, heading: str, focus: str) -> str:
+        """Run one stage 1 search pass on a fresh researcher agent; returns its raw findings."""
+        state = self.state
+        agent = create_legal_recon_agent()
+        task = Task(
+            description=f"""
+Research {state.target_state}'s gambling laws — {heading}.
+
+{focus}
+Use the legal_research tool with search_pass='{search_pass}' and state='{state.target_state}'.
+Read the full text of the most relevant sources with deep_research / fetch_web_page;
+snippets are not enough.
+
+Report what you found as JSON, quoting exact statutory text and citing statute
+numbers, case names and URLs.
+""",
+            expected_output=f"JSON findings for the {search_pass} research pass",
+            agent=agent,
+        )
+        crew = Crew(agents=[agent], tasks=[task], process=Process.sequential,
+                    verbose=PipelineConfig.RECON_VERBOSE)
+        return self._kickoff(crew)
+
     # ────────────────────────────────────────
     # STAGE 2: Definition Analysis
     # ────────────────────────────────────────
@@ -440,7 +957,7 @@ OUTPUT FORMAT (JSON):
 
         console.print("\n[bold yellow]═══ STAGE 2: DEFINITION ANALYSIS ═══[/bold yellow]\n")
 
-        research_json = json.dumps(state.raw_research, indent=2, default=str)
+        research_json = _prompt_json(state, "raw_research")
 
         task = Task(
             description=f"""
@@ -448,7 +965,7 @@ Analyze the following legal research for {state.target_state} and build a struct
 legal profile with actionable game design constraints.
 
 RAW RESEARCH:
-{research_json[:12000]}
+{research_json}
 
 YOUR ANALYSIS MUST INCLUDE:
 
@@ -484,70 +1001,7 @@ YOUR ANALYSIS MUST INCLUDE:
    slot-style game in this state. Rank all viable pathways.
 
 OUTPUT FORMAT (JSON):
-{{
-    "state": "{state.target_state}",
-    "gambling_definition": {{
-        "citation": "...",
-        "elements": ["consideration", "chance", "prize"],
-        "chance_test": "predominance|any_chance|material_element|gambling_instinct",
-        "chance_test_source": "statute|case_law|ag_opinion",
-        "key_language": "exact statutory text..."
-    }},
-    "element_negation_map": {{
-        "chance": {{
-            "can_negate": true/false,
-            "strategy": "...",
-            "minimum_skill_required": "...",
-            "legal_basis": "..."
-        }},
-        "consideration": {{
-            "can_negate": true/false,
-            "strategy": "...",
-            "legal_basis": "..."
-        }},
-        "prize": {{
-            "can_negate": true/false,
-            "strategy": "...",
-            "max_prize": "...",
-            "legal_basis": "..."
-        }}
-    }},
-    "exemptions": [
-        {{
-            "name": "...",
-            "statutory_basis": "...",
-            "requirements": [...],
-            "prize_limits": "...",
-            "location_requirements": "...",
-            "strength": "STRONG|MODERATE|WEAK|UNTESTED",
-            "game_design_constraints": [...]
-        }}
-    ],
-    "court_rulings_analysis": [
-        {{
-            "case": "...",
-            "holding": "...",
-            "impact_on_game_design": "..."
-        }}
-    ],
-    "enforcement_profile": {{
-        "posture": "aggressive|moderate|lax",
-        "primary_enforcer": "AG|DA|gaming_commission|police",
-        "recent_actions": [...],
-        "prosecution_targets": "..."
-    }},
-    "risk_tier": "DEPLOY_NOW|STRUCTURED_DEPLOY|GRAY_AREA|HIGH_RISK|DO_NOT_ENTER",
-    "legal_pathways_ranked": [
-        {{
-            "pathway": "skill_game|amusement_device|sweepstakes|regulated|vlt|other",
-            "viability": "HIGH|MEDIUM|LOW",
-            "legal_theory": "...",
-            "key_risks": [...]
-        }}
-    ],
-    "red_flags": [...],
-    "pending_changes": [...]
-}}
+{_PROFILE_SCHEMA}
 """,
             expected_output="Structured legal profile JSON with element analysis and pathway ranking",
             agent=self.agents["definition_analyzer"],
@@ -557,32 +1011,20 @@ OUTPUT FORMAT (JSON):
             agents=[self.agents["definition_analyzer"]],
             tasks=[task],
             process=Process.sequential,
-            verbose=True,
+            verbose=PipelineConfig.RECON_VERBOSE,
         )
 
-        result = crew.kickoff()
-        raw = result.raw if hasattr(result, "raw") else str(result)
+        raw = self._kickoff(crew)
 
-        try:
-            state.legal_profile = json.loads(raw)
-        except json.JSONDecodeError:
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', raw)
-            if json_match:
-                try:
-                    state.legal_profile = json.loads(json_match.group())
-                except json.JSONDecodeError:
-                    state.legal_profile = {"raw_text": raw}
-            else:
-                state.legal_profile = {"raw_text": raw}
+        _set_result(state, "legal_profile", raw)
 
-        profile_path = Path(state.output_dir) / "02_legal_profile.json"
-        profile_path.write_text(json.dumps(state.legal_profile, indent=2, default=str), encoding="utf-8")
+        profile_path = self.output_path / "02_legal_profile.json"
+        self._write_artifact(profile_path, _state_json(state, "legal_profile"))
         console.print(f"[green]✓ Legal profile saved: {profile_path}[/green]")
 
-        risk = state.legal_profile.get("risk_tier", "UNKNOWN") if isinstance(state.legal_profile, dict) else "UNKNOWN"
+        risk = state.legal_profile.get("risk_tier", "UNKNOWN")
         pathway = "none"
-        pathways = state.legal_profile.get("legal_pathways_ranked", []) if isinstance(state.legal_profile, dict) else []
+        pathways = state.legal_profile.get("legal_pathways_ranked", [])
         if pathways:
             pathway = pathways[0].get("pathway", "unknown")
 
@@ -595,7 +1037,10 @@ OUTPUT FORMAT (JSON):
 
         if risk == "DO_NOT_ENTER":
             console.print(f"[bold red]⚠ {state.target_state} classified as DO_NOT_ENTER[/bold red]")
-            console.print("[red]Proceeding with game architecture for research purposes only.[/red]")
+            if state.auto_mode:
+                console.print("[red]Auto mode: skipping game architecture and defense brief.[/red]")
+            else:
+                console.print("[red]Proceeding with game architecture for research purposes only.[/red]")
 
         recon_hitl("Legal Analysis", summary, state)
         return state
@@ -612,9 +1057,13 @@ OUTPUT FORMAT (JSON):
         if state.errors and "aborted" in state.errors[-1].lower():
             return state
 
+        if self._skip_design():
+            state.game_architecture = {"skipped": True, "reason": "DO_NOT_ENTER"}
+            return state
+
         console.print("\n[bold magenta]═══ STAGE 3: COMPLIANT GAME ARCHITECTURE ═══[/bold magenta]\n")
 
-        profile_json = json.dumps(state.legal_profile, indent=2, default=str)
+        profile_json = _prompt_json(state, "legal_profile")
 
         task = Task(
             description=f"""
@@ -622,7 +1071,7 @@ Design a slot-style game that is LEGALLY DEFENSIBLE in {state.target_state} base
 on the following legal profile:
 
 LEGAL PROFILE:
-{profile_json[:12000]}
+{profile_json}
 
 DESIGN REQUIREMENTS:
 
@@ -653,86 +1102,7 @@ DESIGN REQUIREMENTS:
    record-keeping, tax reporting.
 
 OUTPUT FORMAT (JSON):
-{{
-    "state": "{state.target_state}",
-    "legal_pathway": "...",
-    "legal_classification": "skill_game|amusement_device|sweepstakes|vlt|other",
-
-    "game_concept": {{
-        "name": "...",
-        "description": "...",
-        "player_experience": "..."
-    }},
-
-    "core_mechanics": {{
-        "base_game": {{
-            "type": "reel_spin|card_draw|puzzle|other",
-            "grid": "5x3 or similar",
-            "description": "..."
-        }},
-        "skill_elements": [
-            {{
-                "mechanic": "...",
-                "player_action": "exact description of what player does",
-                "outcome_effect": "exactly how this affects the result",
-                "skill_advantage": "percentage advantage for skilled player",
-                "legal_justification": "maps to which statute/exemption",
-                "implementation_spec": "developer-level detail"
-            }}
-        ],
-        "rng_elements": {{
-            "what_is_random": "...",
-            "what_is_player_controlled": "...",
-            "chance_skill_ratio": "estimated percentage"
-        }}
-    }},
-
-    "prize_structure": {{
-        "form": "cash|gift_card|merchandise|credits|other",
-        "max_single_prize": "...",
-        "payout_mechanism": "...",
-        "statutory_basis": "...",
-        "prohibited_prize_types": [...]
-    }},
-
-    "rtp_design": {{
-        "unskilled_rtp": "...",
-        "skilled_rtp": "...",
-        "theoretical_max": "...",
-        "house_edge": "..."
-    }},
-
-    "prohibited_features": [
-        {{
-            "feature": "...",
-            "reason": "would trigger [statute] because..."
-        }}
-    ],
-
-    "game_flow": [
-        {{
-            "step": 1,
-            "action": "...",
-            "legal_note": "satisfies [requirement] because..."
-        }}
-    ],
-
-    "hardware_requirements": {{
-        "payment_acceptance": "...",
-        "display": "...",
-        "input_devices": "...",
-        "special_requirements": "..."
-    }},
-
-    "operational_requirements": {{
-        "location_types": [...],
-        "licensing": "...",
-        "age_verification": "...",
-        "signage": "...",
-        "record_keeping": "...",
-        "tax_reporting": "..."
-    }}
-}}
+{_ARCHITECTURE_SCHEMA}
 """,
             expected_output="Complete compliant game architecture JSON with statutory mapping",
             agent=self.agents["game_architect"],
@@ -742,42 +1112,26 @@ OUTPUT FORMAT (JSON):
             agents=[self.agents["game_architect"]],
             tasks=[task],
             process=Process.sequential,
-            verbose=True,
+            verbose=PipelineConfig.RECON_VERBOSE,
         )
 
-        result = crew.kickoff()
-        raw = result.raw if hasattr(result, "raw") else str(result)
+        raw = self._kickoff(crew)
 
-        try:
-            state.game_architecture = json.loads(raw)
-        except json.JSONDecodeError:
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', raw)
-            if json_match:
-                try:
-                    state.game_architecture = json.loads(json_match.group())
-                except json.JSONDecodeError:
-                    state.game_architecture = {"raw_text": raw}
-            else:
-                state.game_architecture = {"raw_text": raw}
+        _set_result(state, "game_architecture", raw)
 
-        arch_path = Path(state.output_dir) / "03_game_architecture.json"
-        arch_path.write_text(json.dumps(state.game_architecture, indent=2, default=str), encoding="utf-8")
+        arch_path = self.output_path / "03_game_architecture.json"
+        self._write_artifact(arch_path, _state_json(state, "game_architecture"))
         console.print(f"[green]✓ Game architecture saved: {arch_path}[/green]")
 
-        game_name = "Unknown"
-        skill_count = 0
-        if isinstance(state.game_architecture, dict):
-            concept = state.game_architecture.get("game_concept", {})
-            game_name = concept.get("name", "Unknown")
-            mechs = state.game_architecture.get("core_mechanics", {})
-            skill_count = len(mechs.get("skill_elements", []))
+        arch = state.game_architecture
+        game_name = arch.get("game_concept", {}).get("name", "Unknown")
+        skill_count = len(arch.get("core_mechanics", {}).get("skill_elements", []))
 
         summary = (
             f"Game Architecture for {state.target_state}:\n"
             f"• Game: {game_name}\n"
             f"• Skill elements: {skill_count}\n"
-            f"• Legal pathway: {state.game_architecture.get('legal_pathway', 'unknown') if isinstance(state.game_architecture, dict) else 'unknown'}\n"
+            f"• Legal pathway: {arch.get('legal_pathway', 'unknown')}\n"
         )
 
         recon_hitl("Game Architecture", summary, state)
@@ -795,10 +1149,14 @@ OUTPUT FORMAT (JSON):
         if state.errors and "aborted" in state.errors[-1].lower():
             return state
 
+        if self._skip_design():
+            state.defense_brief = {"skipped": True, "reason": "DO_NOT_ENTER"}
+            return self._finish_recon()
+
         console.print("\n[bold red]═══ STAGE 4: DEFENSE BRIEF ═══[/bold red]\n")
 
-        profile_json = json.dumps(state.legal_profile, indent=2, default=str)
-        arch_json = json.dumps(state.game_architecture, indent=2, default=str)
+        profile_json = _prompt_json(state, "legal_profile")
+        arch_json = _prompt_json(state, "game_architecture")
 
         task = Task(
             description=f"""
@@ -806,10 +1164,10 @@ Generate a comprehensive legal defense brief for operating the proposed game in
 {state.target_state}. This brief should be usable by a real attorney as a starting point.
 
 LEGAL PROFILE:
-{profile_json[:8000]}
+{profile_json}
 
 GAME ARCHITECTURE:
-{arch_json[:8000]}
+{arch_json}
 
 BRIEF MUST INCLUDE:
 
@@ -846,82 +1204,7 @@ BRIEF MUST INCLUDE:
 9. LEGISLATIVE WATCHLIST: Laws or bills that could change the analysis.
 
 OUTPUT FORMAT (JSON):
-{{
-    "state": "{state.target_state}",
-    "brief_date": "...",
-    "disclaimer": "FOR RESEARCH PURPOSES ONLY — NOT LEGAL ADVICE. Requires review by licensed attorney.",
-
-    "executive_summary": "...",
-
-    "statutory_framework": [
-        {{
-            "citation": "...",
-            "title": "...",
-            "relevance": "...",
-            "key_language": "..."
-        }}
-    ],
-
-    "legal_theory": "...",
-
-    "element_by_element_defense": [
-        {{
-            "element": "chance|consideration|prize",
-            "statutory_basis": "...",
-            "game_design_negation": "...",
-            "prosecution_argument": "...",
-            "rebuttal": "...",
-            "supporting_case_law": "...",
-            "strength": "STRONG|MODERATE|WEAK"
-        }}
-    ],
-
-    "exemption_defense": {{
-        "exemption_name": "...",
-        "statutory_basis": "...",
-        "requirement_mapping": [
-            {{
-                "requirement": "...",
-                "game_feature": "...",
-                "compliance_evidence": "..."
-            }}
-        ]
-    }},
-
-    "supporting_case_law": [
-        {{
-            "case": "...",
-            "holding": "...",
-            "application": "..."
-        }}
-    ],
-
-    "risk_matrix": {{
-        "prosecution_probability": "LOW|MEDIUM|HIGH",
-        "conviction_probability_if_prosecuted": "LOW|MEDIUM|HIGH",
-        "penalty_severity": "...",
-        "mitigating_factors": [...],
-        "aggravating_factors": [...]
-    }},
-
-    "prosecutions_best_case": {{
-        "argument": "...",
-        "why_it_fails": "..."
-    }},
-
-    "recommended_precautions": [...],
-
-    "expert_witnesses": [
-        {{
-            "type": "...",
-            "purpose": "..."
-        }}
-    ],
-
-    "legislative_watchlist": [...],
-
-    "overall_assessment": "..."
-}}
+{_BRIEF_SCHEMA}
 """,
             expected_output="Complete legal defense brief JSON",
             agent=self.agents["defense_counsel"],
@@ -931,75 +1214,78 @@ OUTPUT FORMAT (JSON):
             agents=[self.agents["defense_counsel"]],
             tasks=[task],
             process=Process.sequential,
-            verbose=True,
+            verbose=PipelineConfig.RECON_VERBOSE,
         )
 
-        result = crew.kickoff()
-        raw = result.raw if hasattr(result, "raw") else str(result)
+        raw = self._kickoff(crew)
 
-        try:
-            state.defense_brief = json.loads(raw)
-        except json.JSONDecodeError:
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', raw)
-            if json_match:
-                try:
-                    state.defense_brief = json.loads(json_match.group())
-                except json.JSONDecodeError:
-                    state.defense_brief = {"raw_text": raw}
-            else:
-                state.defense_brief = {"raw_text": raw}
+        _set_result(state, "defense_brief", raw)
 
-        brief_path = Path(state.output_dir) / "04_defense_brief.json"
-        brief_path.write_text(json.dumps(state.defense_brief, indent=2, default=str), encoding="utf-8")
+        brief_path = self.output_path / "04_defense_brief.json"
+        self._write_artifact(brief_path, _state_json(state, "defense_brief"))
         console.print(f"[green]✓ Defense brief saved: {brief_path}[/green]")
 
-        state.completed_at = datetime.now().isoformat()
+        return self._finish_recon()
+
+    def _skip_design(self) -> bool:
+        """Stages 3-4 design a game for the state; in auto mode there's no
+        operator to want one for a DO_NOT_ENTER state, so they're skipped.
+        Interactive runs still get them (for research purposes)."""
+        state = self.state
+        return state.auto_mode and state.legal_profile.get("risk_tier") == "DO_NOT_ENTER"
+
+    def _finish_recon(self):
+        """Write the recon package, wait for the stage files, start ingest."""
+        state = self.state
+        state.completed_at = datetime.now().isoformat(timespec="seconds")
+        elapsed = time.monotonic() - self._started
+
+        files = {
+            "raw_research": "01_raw_research.json",
+            "legal_profile": "02_legal_profile.json",
+            "game_architecture": "03_game_architecture.json",
+            "defense_brief": "04_defense_brief.json",
+        }
+        for field in ("game_architecture", "defense_brief"):
+            if getattr(state, field).get("skipped"):
+                # A stale file from an earlier run of this state must not be ingested with this one
+                (self.output_path / files.pop(field)).unlink(missing_ok=True)
 
         # Save complete recon package
         package = {
             "state": state.target_state,
             "started_at": state.started_at,
             "completed_at": state.completed_at,
-            "risk_tier": state.legal_profile.get("risk_tier", "UNKNOWN") if isinstance(state.legal_profile, dict) else "UNKNOWN",
-            "legal_pathway": state.game_architecture.get("legal_pathway", "unknown") if isinstance(state.game_architecture, dict) else "unknown",
-            "files": {
-                "raw_research": "01_raw_research.json",
-                "legal_profile": "02_legal_profile.json",
-                "game_architecture": "03_game_architecture.json",
-                "defense_brief": "04_defense_brief.json",
-            },
+            "risk_tier": state.legal_profile.get("risk_tier", "UNKNOWN"),
+            "legal_pathway": state.game_architecture.get("legal_pathway", "unknown"),
+            "files": files,
             "hitl_approvals": state.hitl_approvals,
             "errors": state.errors,
         }
-        pkg_path = Path(state.output_dir) / "recon_package.json"
-        pkg_path.write_text(json.dumps(package, indent=2), encoding="utf-8")
+        pkg_path = self.output_path / "recon_package.json"
+        self._write_artifact(pkg_path, dumps_bytes(package))
 
         console.print(Panel(
             f"[bold green]✓ RECON COMPLETE: {state.target_state}[/bold green]\n\n"
             f"Risk Tier: {package['risk_tier']}\n"
             f"Legal Pathway: {package['legal_pathway']}\n"
             f"Output: {state.output_dir}/\n"
-            f"Duration: {state.started_at} → {state.completed_at}",
+            f"Duration: {state.started_at} → {state.completed_at} ({elapsed / 60:.1f} min)",
             title="🏁 State Recon Package",
             border_style="green",
         ))
 
+        # Auto-ingest reads these files back from output_dir
+        self._flush_writes()
+
         # ── Auto-ingest into Qdrant ──
         # This makes the data immediately available for future queries
         # so the system gets smarter with every state researched.
+        # Embedding runs in the background; the package is already on disk.
         console.print("\n[bold cyan]Auto-ingesting into Qdrant...[/bold cyan]")
-        try:
-            from tools.auto_ingest import ingest_recon_result
-            ingest_result = ingest_recon_result(state.output_dir, embed=True)
-            if ingest_result:
-                console.print(f"[green]✓ Ingested into Qdrant: {ingest_result.get('state', 'unknown')}[/green]")
-                console.print(f"[green]  RAG doc: {ingest_result.get('rag_path', 'N/A')}[/green]")
-            else:
-                console.print("[yellow]⚠ Ingest returned no result (Qdrant may not be configured)[/yellow]")
-        except Exception as e:
-            console.print(f"[yellow]⚠ Auto-ingest failed: {e}[/yellow]")
-            console.print("[yellow]  Run manually: python -m tools.auto_ingest {state.output_dir} --embed[/yellow]")
+        runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recon-ingest")
+        self._ingest = runner.submit(self._auto_ingest, state.output_dir)
+        runner.shutdown(wait=False)  # its one thread exits once the ingest is done
 
         return state
 
@@ -1008,13 +1294,23 @@ OUTPUT FORMAT (JSON):
 # Convenience launcher
 # ============================================================
 
-def run_recon(state_name: str, auto: bool = False, game_hint: Optional[str] = None, job_id: str = ""):
-    """Run the State Recon Flow on a target state."""
-    flow = StateReconFlow(auto_mode=auto)
+def run_recon(state_name: str, auto: bool = False, game_hint: Optional[str] = None, job_id: str = "",
+              wait_ingest: bool = False, use_cache: bool = False):
+    """
+    Run the State Recon Flow on a target state.
+
+    Qdrant ingest finishes in the background after this returns (the
+    interpreter still waits for it at exit). Pass wait_ingest=True when the
+    caller is about to query the new state's data, and use_cache=True to
+    reuse recent stage outputs for identical prompts (see _kickoff).
+    """
+    flow = StateReconFlow(auto_mode=auto, use_cache=use_cache)
     flow.state.target_state = state_name
     flow.state.game_type_hint = game_hint
     flow.state.job_id = job_id
     result = flow.kickoff()
+    if wait_ingest:
+        flow.wait_ingest()
     return result
 
 
@@ -1028,6 +1324,10 @@ if __name__ == "__main__":
     parser.add_argument("--state", required=True, help="Target US state, e.g. 'North Carolina'")
     parser.add_argument("--auto", action="store_true", help="Skip HITL checkpoints (auto-approve)")
     parser.add_argument("--game-hint", default=None, help="Game type hint, e.g. 'slot-style'")
+    parser.add_argument("--wait-ingest", action="store_true", help="Wait for Qdrant ingest before returning")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse stage outputs cached in the last RECON_CACHE_TTL_H hours for identical prompts")
     args = parser.parse_args()
 
-    run_recon(args.state, auto=args.auto, game_hint=args.game_hint)
+    run_recon(args.state, auto=args.auto, game_hint=args.game_hint,
+              wait_ingest=args.wait_ingest, use_cache=args.cache)
@@ -126,115 +126,161 @@ class SimulationStats:
     win_distribution: dict = field(default_factory=lambda: defaultdict(int))
 
 
-def spin_reels() -> list[list[str]]:
-    """Generate a random grid by spinning all reels."""
-    grid = []
+# The rules run on whole batches of spins with numpy: symbols become
+# integer ids, reel strips int32 arrays, and the paytable a (symbol,
+# length) float array, so a 1M-spin run is a few hundred array operations
+# instead of millions of Python-level loop iterations. This is the only
+# implementation of the rules — the single-grid helpers further down
+# call into it.
+
+BATCH_SIZE = 50_000
+
+SYMBOLS = list(PAYTABLE)
+SYMBOL_ID = {s: i for i, s in enumerate(SYMBOLS)}
+WILD_ID = SYMBOL_ID[WILD_SYMBOL]
+SCATTER_ID = SYMBOL_ID[SCATTER_SYMBOL]
+PAYING_IDS = np.array(
+    [SYMBOL_ID[s] for s in PAYTABLE if s not in (WILD_SYMBOL, SCATTER_SYMBOL) and PAYTABLE[s]],
+    dtype=np.int32,
+)
+
+REEL_ARRAYS = [np.array([SYMBOL_ID[s] for s in REEL_STRIPS[r]], dtype=np.int32) for r in range(NUM_REELS)]
+REEL_LENGTHS = np.array([len(REEL_STRIPS[r]) for r in range(NUM_REELS)], dtype=np.int64)
+
+# For each paying symbol and run length L (reels matched left to right),
+# the longest paytable length <= L and its payout (0 if none).
+PAY_LENGTH = np.zeros((len(PAYING_IDS), NUM_REELS + 1), dtype=np.int64)
+PAY_VALUE = np.zeros((len(PAYING_IDS), NUM_REELS + 1), dtype=np.float64)
+for _i, _sym_id in enumerate(PAYING_IDS):
+    _pays = PAYTABLE[SYMBOLS[_sym_id]]
+    for _run in range(3, NUM_REELS + 1):
+        _best = max((length for length in _pays if length <= _run), default=0)
+        if _best:
+            PAY_LENGTH[_i, _run] = _best
+            PAY_VALUE[_i, _run] = _pays[_best]
+
+# Free spins awarded per scatter count (0 where nothing triggers)
+TRIGGER_SPINS = np.zeros(NUM_REELS * NUM_ROWS + 1, dtype=np.int64)
+for _count, _spins in FREE_SPIN_TRIGGER.items():
+    if _count >= 3:
+        TRIGGER_SPINS[_count] = _spins
+
+WIN_BUCKETS = ["0-1x", "1-2x", "2-5x", "5-20x", "20-100x", "100-1000x", "1000x+"]
+WIN_BUCKET_EDGES = np.array([1, 2, 5, 20, 100, 1000], dtype=np.float64)
+
+
+def spin_reels_batch(n: int) -> np.ndarray:
+    """
+    Spin n grids at once. Each reel picks a random start position and
+    shows NUM_ROWS consecutive stops. Returns symbol ids shaped
+    (n, NUM_REELS, NUM_ROWS).
+    """
+    starts = np.random.randint(0, REEL_LENGTHS, size=(n, NUM_REELS))
+    grids = np.empty((n, NUM_REELS, NUM_ROWS), dtype=np.int32)
+    rows = np.arange(NUM_ROWS)
     for reel_idx in range(NUM_REELS):
-        strip = REEL_STRIPS[reel_idx]
-        num_stops = len(strip)
-        start_pos = np.random.randint(0, num_stops)
-        column = []
-        for row in range(NUM_ROWS):
-            pos = (start_pos + row) % num_stops
-            column.append(strip[pos])
-        grid.append(column)
-    return grid
+        positions = (starts[:, reel_idx, None] + rows) % REEL_LENGTHS[reel_idx]
+        grids[:, reel_idx, :] = REEL_ARRAYS[reel_idx][positions]
+    return grids
 
 
-def evaluate_ways_win(grid: list[list[str]]) -> float:
+def evaluate_ways_win_batch(grids: np.ndarray) -> np.ndarray:
     """
-    Evaluate wins using ways-to-win (left to right).
-    For each paying symbol, count how many appear on each reel
-    (including wilds), then multiply the ways together.
+    Evaluate wins using ways-to-win (left to right), one win amount per grid.
+    For each paying symbol, count how many appear on each reel (including
+    wilds) over the consecutive reels from the left, pay the longest
+    paytable length reached, times the product of the per-reel counts.
     """
-    total_win = 0.0
-
-    # Get unique paying symbols (exclude wild and scatter)
-    paying_symbols = [s for s in PAYTABLE if s not in (WILD_SYMBOL, SCATTER_SYMBOL) and PAYTABLE[s]]
-
-    for symbol in paying_symbols:
-        # Count symbol + wild appearances per reel
-        counts_per_reel = []
-        consecutive_reels = 0
-
-        for reel_idx in range(NUM_REELS):
-            count = sum(
-                1 for row in range(NUM_ROWS)
-                if grid[reel_idx][row] == symbol or grid[reel_idx][row] == WILD_SYMBOL
-            )
-            if count > 0:
-                counts_per_reel.append(count)
-                consecutive_reels += 1
-            else:
-                break  # Must be consecutive from left
-
-        if consecutive_reels < 3:
+    n = grids.shape[0]
+    total_win = np.zeros(n, dtype=np.float64)
+    is_wild = grids == WILD_ID
+    rows_idx = np.arange(n)
+
+    for i, sym_id in enumerate(PAYING_IDS):
+        # Symbol + wild count per reel, then the run of non-zero reels from the left
+        counts = ((grids == sym_id) | is_wild).sum(axis=2)
+        run_length = np.cumprod(counts > 0, axis=1).sum(axis=1)
+
+        pay_length = PAY_LENGTH[i, run_length]
+        paying = pay_length > 0
+        if not paying.any():
             continue
 
-        # Check paytable for each valid length
-        for length in range(consecutive_reels, 2, -1):  # Check longest first
-            if length in PAYTABLE[symbol]:
-                ways = 1
-                for i in range(length):
-                    ways *= counts_per_reel[i]
-                win = PAYTABLE[symbol][length] * ways
-                total_win += win
-                break  # Only pay highest for each symbol
+        # ways = product of per-reel counts over the paid length
+        ways_by_length = np.cumprod(counts, axis=1)
+        ways = ways_by_length[rows_idx[paying], pay_length[paying] - 1]
+        total_win[paying] += PAY_VALUE[i, run_length[paying]] * ways
 
     return total_win
 
 
-def count_scatters(grid: list[list[str]]) -> int:
-    """Count scatter symbols anywhere on the grid."""
-    count = 0
-    for reel in grid:
-        for symbol in reel:
-            if symbol == SCATTER_SYMBOL:
-                count += 1
-    return count
+def count_scatters_batch(grids: np.ndarray) -> np.ndarray:
+    """Scatter count per grid (anywhere on the grid)."""
+    return (grids == SCATTER_ID).sum(axis=(1, 2))
 
 
-def run_free_spins(num_spins: int) -> float:
+def run_free_spins_batch(num_spins: np.ndarray) -> np.ndarray:
     """
-    Execute free spin rounds with multiplier.
-    Returns total win from all free spins.
+    Play free spin rounds for many triggers at once (one entry per trigger).
+    Wins pay FREE_SPIN_MULTIPLIER times; each round spins in lockstep until
+    every trigger has used up its spins, including retriggers. Returns the
+    total feature win per trigger.
     """
-    total_win = 0.0
-    remaining = num_spins
+    total_win = np.zeros(len(num_spins), dtype=np.float64)
+    remaining = num_spins.astype(np.int64)
 
-    while remaining > 0:
-        grid = spin_reels()
-        win = evaluate_ways_win(grid) * FREE_SPIN_MULTIPLIER
-        total_win += win
-        remaining -= 1
+    while True:
+        active = np.flatnonzero(remaining > 0)
+        if active.size == 0:
+            break
+        grids = spin_reels_batch(active.size)
+        total_win[active] += evaluate_ways_win_batch(grids) * FREE_SPIN_MULTIPLIER
+        remaining[active] -= 1
 
-        # Check for retrigger
         if FREE_SPIN_RETRIGGER:
-            sc_count = count_scatters(grid)
-            if sc_count >= 3 and sc_count in FREE_SPIN_TRIGGER:
-                remaining += FREE_SPIN_TRIGGER[sc_count]
+            remaining[active] += TRIGGER_SPINS[count_scatters_batch(grids)]
 
     return total_win
 
 
+def categorize_win_batch(win_amounts: np.ndarray) -> np.ndarray:
+    """Index into WIN_BUCKETS per win (only meaningful for wins > 0)."""
+    return np.searchsorted(WIN_BUCKET_EDGES, win_amounts, side="right")
+
+
+# --- Single-grid helpers (debugging, spot checks) ---
+# Thin wrappers over the batch kernel above; change the rules there.
+
+def _grid_ids(grid: list[list[str]]) -> np.ndarray:
+    """A symbol-name grid as a batch of one id grid."""
+    return np.array([[[SYMBOL_ID[s] for s in reel] for reel in grid]], dtype=np.int32)
+
+
+def spin_reels() -> list[list[str]]:
+    """Generate a random grid by spinning all reels."""
+    return [[SYMBOLS[s] for s in reel] for reel in spin_reels_batch(1)[0]]
+
+
+def evaluate_ways_win(grid: list[list[str]]) -> float:
+    """Ways-to-win payout of one grid."""
+    return float(evaluate_ways_win_batch(_grid_ids(grid))[0])
+
+
+def count_scatters(grid: list[list[str]]) -> int:
+    """Count scatter symbols anywhere on the grid."""
+    return int(count_scatters_batch(_grid_ids(grid))[0])
+
+
+def run_free_spins(num_spins: int) -> float:
+    """Total win from one free spin round of num_spins (plus retriggers)."""
+    return float(run_free_spins_batch(np.array([num_spins]))[0])
+
+
 def categorize_win(win_amount: float) -> str:
     """Categorize a win into a distribution bucket."""
-    if win_amount == 0:
+    if win_amount <= 0:
         return "0x"
-    elif win_amount < 1:
-        return "0-1x"
-    elif win_amount < 2:
-        return "1-2x"
-    elif win_amount < 5:
-        return "2-5x"
-    elif win_amount < 20:
-        return "5-20x"
-    elif win_amount < 100:
-        return "20-100x"
-    elif win_amount < 1000:
-        return "100-1000x"
-    else:
-        return "1000x+"
+    return WIN_BUCKETS[int(categorize_win_batch(np.array([win_amount]))[0])]
 
 
 # ============================================================
@@ -251,37 +297,48 @@ def run_simulation(num_spins: int = 1_000_000) -> dict:
 
     print(f"🎰 Running {num_spins:,} spin simulation...", file=sys.stderr)
 
-    for i in range(num_spins):
-        if i > 0 and i % 250_000 == 0:
-            current_rtp = (stats.total_won / stats.total_wagered * 100) if stats.total_wagered > 0 else 0
-            print(f"  [{i:>10,} / {num_spins:,}] Running RTP: {current_rtp:.4f}%", file=sys.stderr)
-
-        stats.total_spins += 1
-        stats.total_wagered += bet_per_spin
+    next_progress = 250_000
+    done = 0
+    while done < num_spins:
+        n = min(BATCH_SIZE, num_spins - done)
 
         # Spin
-        grid = spin_reels()
-        base_win = evaluate_ways_win(grid)
-        total_spin_win = base_win
-
-        stats.base_game_won += base_win
+        grids = spin_reels_batch(n)
+        base_win = evaluate_ways_win_batch(grids)
+        total_spin_win = base_win.copy()
 
         # Check for free spins
-        scatter_count = count_scatters(grid)
-        if scatter_count >= 3 and scatter_count in FREE_SPIN_TRIGGER:
-            stats.free_spin_triggers += 1
-            num_free_spins = FREE_SPIN_TRIGGER[scatter_count]
-            stats.free_spins_played += num_free_spins
-            feature_win = run_free_spins(num_free_spins)
-            stats.feature_won += feature_win
-            total_spin_win += feature_win
+        awarded = TRIGGER_SPINS[count_scatters_batch(grids)]
+        triggered = np.flatnonzero(awarded > 0)
+        feature_win = 0.0
+        if triggered.size:
+            wins = run_free_spins_batch(awarded[triggered])
+            total_spin_win[triggered] += wins
+            feature_win = float(wins.sum())
+            stats.free_spin_triggers += int(triggered.size)
+            stats.free_spins_played += int(awarded[triggered].sum())
 
         # Track stats
-        if total_spin_win > 0:
-            stats.wins += 1
-        stats.total_won += total_spin_win
-        stats.max_win = max(stats.max_win, total_spin_win)
-        stats.win_distribution[categorize_win(total_spin_win)] += 1
+        stats.total_spins += n
+        stats.total_wagered += n * bet_per_spin
+        stats.base_game_won += float(base_win.sum())
+        stats.feature_won += feature_win
+        stats.total_won += float(total_spin_win.sum())
+        stats.max_win = max(stats.max_win, float(total_spin_win.max()))
+
+        winning = total_spin_win[total_spin_win > 0]
+        stats.wins += int(winning.size)
+        stats.win_distribution["0x"] += n - int(winning.size)
+        bucket_counts = np.bincount(categorize_win_batch(winning), minlength=len(WIN_BUCKETS))
+        for bucket, count in zip(WIN_BUCKETS, bucket_counts):
+            if count:
+                stats.win_distribution[bucket] += int(count)
+
+        done += n
+        if done >= next_progress and done < num_spins:
+            current_rtp = (stats.total_won / stats.total_wagered * 100) if stats.total_wagered > 0 else 0
+            print(f"  [{done:>10,} / {num_spins:,}] Running RTP: {current_rtp:.4f}%", file=sys.stderr)
+            next_progress += 250_000
 
     # === Calculate Final Metrics ===
     measured_rtp = (stats.total_won / stats.total_wagered) * 100
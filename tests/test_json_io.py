@@ -0,0 +1,121 @@
+"""json_io: orjson and the stdlib fallback must write and read the same JSON."""
+
+import dataclasses
+import datetime
+import json
+import math
+
+import numpy as np
+import pytest
+
+from tools import json_io
+
+
+@dataclasses.dataclass
+class Symbol:
+    name: str
+    pays: int
+
+
+SAMPLE = {
+    "theme": "Dragon's Hoard — 龍",
+    "rtp": 96.52,
+    "tiny": 1e-12,
+    "spins": 1_000_000,
+    "volatility": None,
+    "retrigger": True,
+    "grid": (5, 3),
+    "features": ["free_spins", {"multiplier": 3, "stack": []}],
+    1: "int key",
+    "np_int": np.int64(42),
+    "np_float": np.float32(0.25),
+    "np_array": np.arange(6, dtype=np.int32).reshape(2, 3),
+    "completed_at": datetime.datetime(2026, 10, 16, 9, 30, 5),
+    "symbol": Symbol("H1", 40),
+    "opaque": type("Opaque", (), {"__str__": lambda self: "opaque"})(),
+}
+
+EXPECTED = {
+    "theme": "Dragon's Hoard — 龍",
+    "rtp": 96.52,
+    "tiny": 1e-12,
+    "spins": 1_000_000,
+    "volatility": None,
+    "retrigger": True,
+    "grid": [5, 3],
+    "features": ["free_spins", {"multiplier": 3, "stack": []}],
+    "1": "int key",
+    "np_int": 42,
+    "np_float": 0.25,
+    "np_array": [[0, 1, 2], [3, 4, 5]],
+    "completed_at": "2026-10-16 09:30:05",
+    "symbol": "Symbol(name='H1', pays=40)",
+    "opaque": "opaque",
+}
+
+backends = pytest.mark.parametrize("use_orjson", [
+    pytest.param(True, marks=pytest.mark.skipif(json_io.orjson is None, reason="orjson not installed")),
+    False,
+])
+
+
+@pytest.fixture
+def backend(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_io, "orjson", None)
+
+
+@backends
+@pytest.mark.parametrize("indent", [True, False])
+def test_dumps_round_trip(backend, indent):
+    data = json_io.dumps_bytes(SAMPLE, indent=indent)
+    assert json.loads(data) == EXPECTED
+    assert json_io.loads(data) == EXPECTED
+
+
+@backends
+def test_compact_and_indented_layout(backend):
+    assert json_io.dumps_bytes({"a": [1, 2]}, indent=False) == b'{"a":[1,2]}'
+    assert json_io.dumps_bytes({"a": [1, 2]}) == b'{\n  "a": [\n    1,\n    2\n  ]\n}'
+
+
+@backends
+@pytest.mark.parametrize("indent", [True, False])
+def test_write_then_read(backend, tmp_path, indent):
+    path = json_io.write_json(tmp_path / "out.json", SAMPLE, indent=indent)
+    assert json_io.read_json(path) == EXPECTED
+
+
+def test_backends_write_identical_compact_ascii(monkeypatch):
+    if json_io.orjson is None:
+        pytest.skip("orjson not installed")
+    data = {"rtp": 96.5, "hits": [0.1, 2, None], "np": np.float64(0.3), "k": {"nested": True}}
+    fast = json_io.dumps_bytes(data, indent=False)
+    monkeypatch.setattr(json_io, "orjson", None)
+    assert json_io.dumps_bytes(data, indent=False) == fast
+
+
+@backends
+def test_ints_beyond_64_bits(backend):
+    assert json_io.loads(json_io.dumps_bytes({"n": 2 ** 70, "a": np.int64(1)})) == {"n": 2 ** 70, "a": 1}
+
+
+@backends
+def test_loads_accepts_stdlib_non_finite_floats(backend):
+    value = json_io.loads(json.dumps({"trigger_freq": float("inf"), "x": float("nan")}))
+    assert value["trigger_freq"] == math.inf and math.isnan(value["x"])
+
+
+@backends
+def test_read_json_missing_or_invalid(backend, tmp_path):
+    assert json_io.read_json(tmp_path / "missing.json") is None
+    (tmp_path / "agent.json").write_text("Here is the JSON: {", encoding="utf-8")
+    assert json_io.read_json(tmp_path / "agent.json") is None
+    (tmp_path / "latin1.json").write_bytes(b'{"a": "\xe9"}')
+    assert json_io.read_json(tmp_path / "latin1.json") is None
+
+
+@backends
+def test_loads_rejects_invalid(backend):
+    with pytest.raises(ValueError):
+        json_io.loads("{'single': 'quotes'}")
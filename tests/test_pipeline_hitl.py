@@ -0,0 +1,70 @@
+"""_hitl_files: the newest-files listing shown next to a web HITL review."""
+
+import os
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from config.settings import PipelineConfig
+from flows.pipeline import PipelineState, _hitl_files
+
+
+def make_tree(root, count):
+    """count files spread over nested dirs, file i with mtime i seconds."""
+    paths = []
+    for i in range(count):
+        sub = root / f"0{i % 3}_stage" / ("images" if i % 2 else "")
+        sub.mkdir(parents=True, exist_ok=True)
+        path = sub / f"file_{i:02d}.json"
+        path.write_text("{}")
+        os.utime(path, ns=(i * 10**9, (1_000 + i) * 10**9))
+        paths.append(os.path.relpath(path, root))
+    return paths
+
+
+@pytest.fixture
+def state(tmp_path):
+    return PipelineState(output_dir=str(tmp_path))
+
+
+def test_newest_twenty_sorted_by_path(tmp_path, state):
+    paths = make_tree(tmp_path, 25)
+    assert _hitl_files("post_research", state) == sorted(paths[5:])
+
+
+def test_limit(tmp_path, state):
+    paths = make_tree(tmp_path, 8)
+    assert _hitl_files("post_research", state, limit=3) == sorted(paths[5:])
+
+
+def test_symlinks_are_skipped(tmp_path, state):
+    paths = make_tree(tmp_path, 3)
+    (tmp_path / "link.json").symlink_to(tmp_path / paths[0])
+    assert _hitl_files("post_research", state) == sorted(paths)
+
+
+def test_missing_output_dir(tmp_path):
+    assert _hitl_files("post_research", PipelineState(output_dir=str(tmp_path / "gone"))) == []
+
+
+def test_stages_without_files(tmp_path, state, monkeypatch):
+    make_tree(tmp_path, 3)
+    monkeypatch.setattr(PipelineConfig, "HITL_STAGES_WITHOUT_FILES", frozenset({"post_art"}))
+    assert _hitl_files("post_art", state) == []
+    assert len(_hitl_files("post_research", state)) == 3
+
+
+def test_listing_is_reused_until_a_file_is_added(tmp_path, state):
+    paths = make_tree(tmp_path, 25)
+    first = _hitl_files("post_research", state)
+    first.append("mutating the result must not touch the cache")
+    assert _hitl_files("post_design", state) == sorted(paths[5:])
+
+    new = tmp_path / "04_art" / "hero.png"
+    new.parent.mkdir()
+    new.write_bytes(b"png")
+    os.utime(new, ns=(0, 5_000 * 10**9))
+    listing = _hitl_files("post_art", state)
+    assert os.path.join("04_art", "hero.png") in listing
+    assert paths[5] not in listing and len(listing) == 20
@@ -0,0 +1,104 @@
+"""Tool registry: shared instances and per-run dedup of read-only tool calls."""
+
+import json
+
+import pytest
+
+from tools import registry
+
+
+class CountingTool:
+    """Stands in for a BaseTool: records every real _run call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def _run(self, query: str, limit: int = 5):
+        self.calls.append((query, limit))
+        if query.startswith("fail-dict"):
+            return {"error": "timeout"}
+        if query.startswith("fail-json"):
+            return json.dumps({"status": "error", "message": "rate limited"})
+        return f"result for {query} ({len(self.calls)})"
+
+
+@pytest.fixture
+def tool():
+    return registry._with_run_cache("fake_search", CountingTool)()
+
+
+def test_outside_a_run_every_call_runs(tool):
+    tool._run("slots")
+    tool._run("slots")
+    assert len(tool.calls) == 2
+
+
+def test_identical_calls_in_a_run_run_once(tool):
+    with registry.tool_run_cache():
+        first = tool._run("slots", limit=3)
+        assert tool._run("slots", limit=3) == first
+        tool._run("slots", limit=4)
+        tool._run(query="slots", limit=3)
+    # Different args, or the same args passed differently, are separate calls
+    assert tool.calls == [("slots", 3), ("slots", 4), ("slots", 3)]
+
+
+def test_runs_do_not_share_results(tool):
+    with registry.tool_run_cache():
+        tool._run("slots")
+    with registry.tool_run_cache():
+        tool._run("slots")
+    assert len(tool.calls) == 2
+
+
+@pytest.mark.parametrize("query", ["fail-dict", "fail-json"])
+def test_errors_are_not_cached(tool, query):
+    with registry.tool_run_cache():
+        tool._run(query)
+        tool._run(query)
+    assert len(tool.calls) == 2
+
+
+@pytest.mark.parametrize("result, expected", [
+    ({"error": "x"}, True),
+    ({"status": "ERROR"}, True),
+    ('{"error": "boom"}', True),
+    ('  {"status": "error"}', True),
+    ({"status": "ok", "data": []}, False),
+    ('{"results": []}', False),
+    ("plain text mentioning an error", False),
+    ("{not json", False),
+    ([{"error": "x"}], False),
+])
+def test_is_error(result, expected):
+    assert registry._is_error(result) is expected
+
+
+def test_wrapped_class_keeps_its_identity():
+    cls = registry._with_run_cache("fake_search", CountingTool)
+    assert issubclass(cls, CountingTool)
+    assert cls.__name__ == "CountingTool" and cls.__module__ == CountingTool.__module__
+
+
+def test_get_tool_builds_one_instance_and_wraps_only_cacheable(monkeypatch):
+    monkeypatch.setattr(registry, "TOOL_REGISTRY", {})
+    monkeypatch.setattr(registry, "_TOOL_CLASSES", {
+        "fake_search": (__name__, "CountingTool"),
+        "fake_writer": (__name__, "CountingTool"),
+    })
+    monkeypatch.setattr(registry, "CACHEABLE_TOOLS", frozenset({"fake_search"}))
+
+    search = registry.get_tool("fake_search")
+    assert registry.get_tool("fake_search") is search
+    writer = registry.get_tool("fake_writer")
+    assert type(writer) is CountingTool and type(search) is not CountingTool
+
+    with registry.tool_run_cache():
+        search._run("a")
+        search._run("a")
+        writer._run("a")
+        writer._run("a")
+    assert len(search.calls) == 1 and len(writer.calls) == 2
+
+    with pytest.raises(KeyError):
+        registry.get_tool("no_such_tool")
@@ -0,0 +1,41 @@
+"""_parse_agent_json: how State Recon turns an agent's answer into a stage dict."""
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from flows.state_recon import _parse_agent_json
+
+
+def test_bare_object_is_exact():
+    raw = '  {"risk_tier": "LOW", "statutes": ["A-1"]}\n'
+    assert _parse_agent_json(raw) == ({"risk_tier": "LOW", "statutes": ["A-1"]}, True)
+
+
+def test_non_object_json_is_wrapped():
+    raw = '["not", "a", "dict"]'
+    assert _parse_agent_json(raw) == ({"raw_text": raw}, False)
+
+
+def test_object_inside_prose():
+    raw = 'Here is the profile:\n{"risk_tier": "HIGH"}\nLet me know if you need more.'
+    assert _parse_agent_json(raw) == ({"risk_tier": "HIGH"}, False)
+
+
+def test_braces_inside_strings_and_trailing_object():
+    # A first-'{'-to-last-'}' span would swallow both objects and fail to parse
+    raw = 'Result: {"note": "see } and {", "nested": {"n": 1}} and also {"other": 2}'
+    assert _parse_agent_json(raw) == ({"note": "see } and {", "nested": {"n": 1}}, False)
+
+
+def test_stray_brace_before_json():
+    raw = 'Checked {three sources. Answer: {"legal_pathway": "sweepstakes"}'
+    assert _parse_agent_json(raw) == ({"legal_pathway": "sweepstakes"}, False)
+
+
+def test_no_json_keeps_the_raw_string():
+    raw = "The statute could not be retrieved {timeout"
+    value, exact = _parse_agent_json(raw)
+    assert value == {"raw_text": raw} and not exact
+    # _kickoff only caches answers that parsed: it checks for this very object
+    assert value["raw_text"] is raw
@@ -0,0 +1,121 @@
+"""Web HITL: the poll backoff schedule and the review round-trip through SQLite."""
+
+import importlib
+import sqlite3
+import types
+
+import pytest
+
+
+class FakeClock:
+    """monotonic()/sleep() pair where sleeping just advances the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def web_hitl(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "hitl.db")
+    # The module creates its table on import, in DB_PATH
+    monkeypatch.setenv("DB_PATH", db_path)
+    module = importlib.import_module("tools.web_hitl")
+    monkeypatch.setattr(module, "DB_PATH", db_path)
+    module.init_reviews_table()
+    with sqlite3.connect(db_path) as db:
+        # The columns of web_app's jobs table that the review queries join on
+        db.execute("CREATE TABLE IF NOT EXISTS jobs "
+                   "(id TEXT PRIMARY KEY, title TEXT, output_dir TEXT, current_stage TEXT)")
+        db.execute("INSERT INTO jobs VALUES ('job1', 'Dragon Slots', 'output/dragon', 'running')")
+    return module
+
+
+@pytest.fixture
+def clock(web_hitl, monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(web_hitl, "time", types.SimpleNamespace(monotonic=fake.monotonic, sleep=fake.sleep))
+    return fake
+
+
+def schedule(backoff, clock, polls, rtt=0.01):
+    delays = []
+    for _ in range(polls):
+        delay = backoff.next_delay()
+        if delay is None:
+            break
+        delays.append(delay)
+        clock.sleep(delay)
+        backoff.polled(rtt)
+    return delays
+
+
+def test_backoff_doubles_up_to_the_cap(web_hitl, clock):
+    backoff = web_hitl._PollBackoff("rev_1", timeout=3600, max_interval=2.0)
+    assert schedule(backoff, clock, 6) == [0.5, 1.0, 2.0, 2.0, 2.0, 2.0]
+
+
+def test_backoff_starts_at_a_cap_below_half_a_second(web_hitl, clock):
+    backoff = web_hitl._PollBackoff("rev_1", timeout=3600, max_interval=0.2)
+    assert schedule(backoff, clock, 3) == [0.2, 0.2, 0.2]
+
+
+def test_slow_round_trips_raise_the_cap(web_hitl, clock):
+    # A 0.5s query keeps polling under ~5% of wall time: cap = 20 * rtt
+    backoff = web_hitl._PollBackoff("rev_1", timeout=3600, max_interval=2.0)
+    assert schedule(backoff, clock, 7, rtt=0.5) == [0.5, 1.0, 2.0, 4.0, 8.0, 10.0, 10.0]
+
+
+def test_last_wait_is_clipped_to_the_timeout(web_hitl, clock):
+    backoff = web_hitl._PollBackoff("rev_1", timeout=3, max_interval=2.0)
+    assert schedule(backoff, clock, 10) == [0.5, 1.0, 1.5]
+    assert backoff.next_delay() is None
+
+
+def test_heartbeat_every_30_polls(web_hitl, clock, capsys):
+    backoff = web_hitl._PollBackoff("rev_1", timeout=3600, max_interval=2.0)
+    schedule(backoff, clock, 60)
+    heartbeats = [line for line in capsys.readouterr().out.splitlines() if "Still waiting" in line]
+    assert len(heartbeats) == 2 and "rev_1" in heartbeats[0]
+
+
+def test_auto_approves_without_touching_the_db(web_hitl, clock):
+    assert web_hitl.web_hitl_checkpoint("job1", "post_research", "Research", "...", auto=True) == (True, "")
+    assert web_hitl.get_pending_reviews() == []
+    assert clock.sleeps == []
+
+
+def test_checkpoint_returns_the_submitted_review(web_hitl, clock, monkeypatch):
+    create = web_hitl._create_review
+
+    def create_and_reject(*args, **kwargs):
+        review_id = create(*args, **kwargs)
+        pending = web_hitl.get_pending_reviews("job1")
+        assert [r["id"] for r in pending] == [review_id]
+        assert pending[0]["stage"] == "post_design" and pending[0]["job_title"] == "Dragon Slots"
+        web_hitl.submit_review(review_id, approved=False, feedback="RTP too low")
+        return review_id
+
+    monkeypatch.setattr(web_hitl, "_create_review", create_and_reject)
+    result = web_hitl.web_hitl_checkpoint("job1", "post_design", "Design", "GDD ready",
+                                          files=["02_design/gdd.md"], timeout=60)
+    assert result == (False, "RTP too low")
+    # Resolved on the first poll, after the first 0.5s wait
+    assert clock.sleeps == [0.5]
+    with sqlite3.connect(web_hitl.DB_PATH) as db:
+        stage = db.execute("SELECT current_stage FROM jobs WHERE id='job1'").fetchone()[0]
+    assert stage.endswith("Waiting for review: Design")
+
+
+def test_unanswered_review_is_auto_approved_at_the_timeout(web_hitl, clock):
+    result = web_hitl.web_hitl_checkpoint("job1", "post_art", "Art", "Mood boards", timeout=5)
+    assert result == (True, "Auto-approved (timeout)")
+    assert sum(clock.sleeps) == pytest.approx(5)
+    assert web_hitl.get_pending_reviews("job1") == []
@@ -0,0 +1,103 @@
+"""
+ARKAINBRAIN — JSON artifact I/O
+
+Every stage writes its results as JSON files under output_dir. This module
+is the one place that serializes and parses them: orjson when it's installed (several
+times faster, emits UTF-8 bytes directly), stdlib json otherwise. Output
+parses to the same values either way, except non-finite floats: stdlib
+writes NaN/Infinity, orjson null.
+
+Usage:
+    from tools.json_io import loads, read_json, write_json
+    write_json(Path(output_dir, "00_preflight", "trend_radar.json"), radar_result)
+    sim = read_json(Path(output_dir, "03_math", "simulation_results.json"))
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+if orjson is not None:
+    # datetimes and dataclasses go through _default like they do on stdlib
+    _ORJSON_OPTS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+
+def _default(obj):
+    """Fallback for types json can't encode: numpy scalars and arrays become
+    numbers and lists (as orjson's OPT_SERIALIZE_NUMPY writes them),
+    anything else its str()."""
+    tolist = getattr(obj, "tolist", None)
+    if callable(tolist):
+        return tolist()
+    return str(obj)
+
+
+def dumps_bytes(obj, indent: bool = True) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, indented or fully compact (no
+    spaces after separators). Unknown types go through _default."""
+    if orjson is not None:
+        opts = _ORJSON_OPTS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTS
+        try:
+            return orjson.dumps(obj, default=_default, option=opts)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits — let stdlib handle it
+    if indent:
+        return json.dumps(obj, indent=2, default=_default).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def write_json(path, obj, indent: bool = True) -> Path:
+    """
+    Write obj as JSON to path.
+
+    orjson output goes to disk as one bytes write. Without orjson, indented
+    output is streamed through a 1 MB buffer instead of being built as one
+    big string first: stdlib's indented encoder is pure Python either way,
+    so streaming costs nothing and halves peak memory on large research
+    dumps. Compact output keeps json.dumps, whose C encoder json.dump can't
+    use.
+    """
+    path = Path(path)
+    if orjson is None and indent:
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(obj, f, indent=2, default=_default)
+    else:
+        path.write_bytes(dumps_bytes(obj, indent=indent))
+    return path
+
+
+def loads(data):
+    """
+    Parse JSON from str or bytes; raises ValueError if it isn't valid.
+
+    orjson parses when installed; anything it rejects but stdlib accepts
+    (NaN/Infinity, which json.dumps emits for e.g. an infinite trigger
+    frequency) is retried with json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def read_json(path):
+    """
+    Parse the JSON file at path with loads(). Returns None if it doesn't
+    exist or isn't valid JSON (agents write some of these files, so both
+    happen). One open, no exists() check first.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+    try:
+        return loads(data)
+    except ValueError:  # JSONDecodeError, or bytes that aren't UTF-8
+        return None
@@ -11,12 +11,53 @@ Designed for the State Recon Agent to autonomously research new jurisdictions.
 
 import json
 import os
+import re
+import threading
 from typing import Optional
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 
+# ============================================================
+# Shared HTTP client
+# ============================================================
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _http_client():
+    """
+    One keep-alive httpx.Client for every Serper query and statute fetch in
+    the process, so a recon run's dozens of calls to the same few hosts
+    reuse TLS connections instead of handshaking each time. httpx.Client is
+    thread-safe (stage 1's search passes run concurrently). Raises
+    ImportError if httpx isn't installed.
+    """
+    global _client
+    if _client is None:
+        import httpx
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                )
+    return _client
+
+
+# ============================================================
+# HTML → text (StatuteFetchTool._strip_html)
+# ============================================================
+
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+# Closing block tags and <br> both become a newline, so one pass does both
+_BLOCK_BREAK_RE = re.compile(r'</(?:p|div|h[1-6]|li|tr|br)>|<br\s*/?\s*>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_SPACES_RE = re.compile(r'[ \t]+')
+
+
 # ============================================================
 # Search Strategy Templates
 # ============================================================
@@ -146,7 +187,7 @@ class LegalResearchTool(BaseTool):
             })
 
         try:
-            import httpx
+            client = _http_client()
         except ImportError:
             return json.dumps({"error": "httpx not installed. Run: pip install httpx"})
 
@@ -172,7 +213,7 @@ class LegalResearchTool(BaseTool):
 
         for query in queries:
             try:
-                resp = httpx.post(
+                resp = client.post(
                     "https://google.serper.dev/search",
                     headers={"X-API-KEY": serper_key, "Content-Type": "application/json"},
                     json={"q": query, "num": 5},
@@ -305,12 +346,12 @@ class StatuteFetchTool(BaseTool):
 
     def _run(self, url: str, extract_sections: Optional[str] = None) -> str:
         try:
-            import httpx
+            client = _http_client()
         except ImportError:
             return json.dumps({"error": "httpx not installed"})
 
         try:
-            resp = httpx.get(
+            resp = client.get(
                 url,
                 headers={"User-Agent": "Mozilla/5.0 (research bot)"},
                 timeout=20.0,
@@ -351,22 +392,19 @@ class StatuteFetchTool(BaseTool):
 
     def _strip_html(self, html: str) -> str:
         """Basic HTML to text conversion."""
-        import re
         # Remove script/style blocks
-        text = re.sub(r'<(script|style)[^>]*>.*?</\1>', '', html, flags=re.DOTALL | re.IGNORECASE)
+        text = _SCRIPT_STYLE_RE.sub('', html)
         # Convert block elements to newlines
-        text = re.sub(r'</(p|div|h[1-6]|li|tr|br)>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'<br\s*/?\s*>', '\n', text, flags=re.IGNORECASE)
+        text = _BLOCK_BREAK_RE.sub('\n', text)
         # Remove all remaining tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _TAG_RE.sub('', text)
         # Clean up whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r'[ \t]+', ' ', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
+        text = _SPACES_RE.sub(' ', text)
         return text.strip()
 
     def _extract_sections(self, text: str, sections: list) -> Optional[str]:
         """Extract specific statute section numbers from text."""
-        import re
         extracted = []
         for section in sections:
             # Try to find section marker and grab surrounding context
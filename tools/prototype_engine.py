@@ -98,6 +98,9 @@ def _discover_background(art_dir: str) -> str:
     return ""
 
 
+_AUDIO_MIME = {".mp3": "audio/mpeg", ".wav": "audio/wav"}
+
+
 def _discover_audio(audio_dir: str) -> dict:
     """Find audio files and return {sound_type: base64_data_uri}."""
     if not audio_dir or not Path(audio_dir).exists():
@@ -105,9 +108,9 @@ def _discover_audio(audio_dir: str) -> dict:
     found = {}
     audio_path = Path(audio_dir)
     for af in audio_path.rglob("*"):
-        if af.suffix.lower() in (".mp3", ".wav"):
+        mime = _AUDIO_MIME.get(af.suffix.lower())
+        if mime:
             name = af.stem.lower()
-            mime = "audio/mpeg" if af.suffix == ".mp3" else "audio/wav"
             try:
                 # Only embed small files (<500KB) to keep prototype reasonable
                 if af.stat().st_size < 512_000:
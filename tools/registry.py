@@ -0,0 +1,148 @@
+"""
+ARKAINBRAIN — Shared Tool Registry
+
+One instance of each tool per process. Agents that use the same tool
+(e.g. web_fetch on the analyst, compliance officer and adversarial
+reviewer) get the same object instead of building their own.
+
+Read-only tools also dedupe identical calls within one pipeline run:
+inside `with tool_run_cache():` the second agent to fetch the same URL
+or run the same search gets the first agent's result. Error results
+aren't cached, so a retry after a timeout really retries.
+
+Usage:
+    from tools.registry import get_tool, tool_run_cache
+    web_fetch = get_tool("web_fetch")
+    with tool_run_cache():
+        flow.kickoff()
+"""
+
+import hashlib
+import importlib
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+# name → (module, class). Modules are imported on first use so a missing
+# optional dependency only breaks the tools that need it.
+_TOOL_CLASSES = {
+    # Core tools
+    "slot_search": ("tools.custom_tools", "SlotDatabaseSearchTool"),
+    "math_sim": ("tools.custom_tools", "MathSimulationTool"),
+    "image_gen": ("tools.custom_tools", "ImageGenerationTool"),
+    "reg_rag": ("tools.custom_tools", "RegulatoryRAGTool"),
+    "file_writer": ("tools.custom_tools", "FileWriterTool"),
+
+    # Advanced tools (UPGRADES 1-4)
+    "web_fetch": ("tools.advanced_research", "WebFetchTool"),
+    "deep_research": ("tools.advanced_research", "DeepResearchTool"),
+    "competitor_teardown": ("tools.advanced_research", "CompetitorTeardownTool"),
+    "knowledge_base": ("tools.advanced_research", "KnowledgeBaseTool"),
+
+    # Tier 1 tools (UPGRADES 6-11)
+    "vision_qa": ("tools.tier1_upgrades", "VisionQATool"),
+    "vision_qa_batch": ("tools.tier1_upgrades", "VisionQABatchTool"),
+    "paytable_optimizer": ("tools.tier1_upgrades", "PaytableOptimizerTool"),
+    "jurisdiction_intersect": ("tools.tier1_upgrades", "JurisdictionIntersectionTool"),
+    "player_behavior": ("tools.tier1_upgrades", "PlayerBehaviorModelTool"),
+    "agent_debate": ("tools.tier1_upgrades", "AgentDebateTool"),
+    "trend_radar": ("tools.tier1_upgrades", "TrendRadarTool"),
+
+    # Tier 2 tools (UPGRADES 12-15)
+    "patent_scanner": ("tools.tier2_upgrades", "PatentIPScannerTool"),
+    "prototype_gen": ("tools.tier2_upgrades", "HTML5PrototypeTool"),
+    "sound_design": ("tools.tier2_upgrades", "SoundDesignTool"),
+    "cert_planner": ("tools.tier2_upgrades", "CertificationPlannerTool"),
+
+    # Legal research (State Recon)
+    "legal_search": ("tools.legal_research_tool", "LegalResearchTool"),
+    "statute_fetch": ("tools.legal_research_tool", "StatuteFetchTool"),
+}
+
+# Tools whose output depends only on their arguments (no files written,
+# no images generated, no randomness), so repeat calls can be served from
+# the run cache.
+CACHEABLE_TOOLS = frozenset({
+    "slot_search", "reg_rag",
+    "web_fetch", "deep_research", "competitor_teardown",
+    "jurisdiction_intersect", "trend_radar",
+    "patent_scanner",
+    "legal_search", "statute_fetch",
+})
+
+TOOL_REGISTRY: dict = {}
+_lock = threading.Lock()
+
+# {call_key: result} for the current pipeline run; None outside a run
+_run_cache: ContextVar[Optional[dict]] = ContextVar("tool_run_cache", default=None)
+
+
+@contextmanager
+def tool_run_cache():
+    """Scope tool-call dedup to one run so results never leak across jobs."""
+    token = _run_cache.set({})
+    try:
+        yield
+    finally:
+        _run_cache.reset(token)
+
+
+def _call_key(name: str, args: tuple, kwargs: dict) -> str:
+    payload = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True, default=str)
+    return f"{name}:{hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()}"
+
+
+def _is_error(result) -> bool:
+    """True for a tool's error payload ({"error": ...} or "status": "error"),
+    given as a dict or its JSON string. Those are often transient (timeouts,
+    rate limits), so they're never cached: a retry gets a fresh call."""
+    if isinstance(result, str):
+        if not result.lstrip().startswith("{"):
+            return False
+        try:
+            result = json.loads(result)
+        except ValueError:
+            return False
+    return isinstance(result, dict) and (
+        "error" in result or str(result.get("status", "")).lower() == "error"
+    )
+
+
+def _with_run_cache(name: str, tool_cls: type) -> type:
+    """Subclass a tool so _run consults the run cache before doing any work."""
+    original_run = tool_cls._run
+
+    def _run(self, *args, **kwargs):
+        cache = _run_cache.get()
+        if cache is None:
+            return original_run(self, *args, **kwargs)
+        key = _call_key(name, args, kwargs)
+        if key in cache:
+            return cache[key]
+        result = original_run(self, *args, **kwargs)
+        if not _is_error(result):
+            cache[key] = result
+        return result
+
+    return type(tool_cls.__name__, (tool_cls,), {"_run": _run, "__module__": tool_cls.__module__})
+
+
+def get_tool(name: str):
+    """Return the shared instance of a tool, building it on first request."""
+    tool = TOOL_REGISTRY.get(name)
+    if tool is not None:
+        return tool
+    if name not in _TOOL_CLASSES:
+        raise KeyError(f"Unknown tool: {name}")
+    with _lock:
+        tool = TOOL_REGISTRY.get(name)
+        if tool is None:
+            module_name, class_name = _TOOL_CLASSES[name]
+            tool_cls = getattr(importlib.import_module(module_name), class_name)
+            if name in CACHEABLE_TOOLS:
+                tool_cls = _with_run_cache(name, tool_cls)
+            tool = tool_cls()
+            TOOL_REGISTRY[name] = tool
+    return tool
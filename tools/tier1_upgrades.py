@@ -2,6 +2,7 @@
 ARKAINBRAIN — Tier 1 Intelligence Upgrades
 
 UPGRADE 6:  VisionQATool          — GPT-4o vision analyzes generated images
+            VisionQABatchTool     — same checks for a whole image set in one call
 UPGRADE 7:  PaytableOptimizerTool — Iterative reel strip optimization converging on target RTP
 UPGRADE 8:  JurisdictionIntersect — Computes the legal intersection across multiple markets
 UPGRADE 9:  PlayerBehaviorModel   — Simulates player session dynamics, churn risk, engagement
@@ -29,6 +30,32 @@ from pydantic import BaseModel, Field
 # This tool encodes the image as base64, sends it to GPT-4o-vision,
 # and gets a structured QA report.
 
+def _image_part(path: Path) -> dict:
+    """Base64-encode an image file as an OpenAI vision message part."""
+    import base64
+
+    b64 = base64.b64encode(path.read_bytes()).decode("utf-8")
+    ext = path.suffix.lower().lstrip(".")
+    mime = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg", "webp": "image/webp"}.get(ext, "image/png")
+    return {"type": "image_url", "image_url": {"url": f"data:{mime};base64,{b64}", "detail": "high"}}
+
+
+def _qa_prompt_head(qa_prompts: dict, qa_context: str, theme: str, requirements: str) -> str:
+    """QA criteria + grading instructions shared by single and batch vision QA."""
+    base_prompt = qa_prompts.get(qa_context, qa_prompts["slot_symbol"])
+    return (
+        f"{base_prompt}\n"
+        f"THEME: {theme}\n"
+        f"ADDITIONAL REQUIREMENTS: {requirements}\n\n"
+        f"For each criterion, respond with:\n"
+        f"- Grade: PASS / WARN / FAIL\n"
+        f"- Brief explanation (1 sentence)\n"
+        f"- Fix suggestion if WARN or FAIL\n\n"
+        f"End with an OVERALL VERDICT: PASS / PASS_WITH_WARNINGS / FAIL\n"
+        f"And a 1-sentence summary.\n\n"
+    )
+
+
 class VisionQAInput(BaseModel):
     image_path: str = Field(description="Path to the image file to analyze")
     qa_context: str = Field(
@@ -114,30 +141,13 @@ class VisionQATool(BaseTool):
             return json.dumps({"error": f"Image not found: {image_path}", "status": "skipped"})
 
         try:
-            import base64
             from openai import OpenAI
 
             client = OpenAI(api_key=api_key)
 
-            # Encode image
-            with open(path, "rb") as f:
-                b64 = base64.b64encode(f.read()).decode("utf-8")
-
-            ext = path.suffix.lower().lstrip(".")
-            mime = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg", "webp": "image/webp"}.get(ext, "image/png")
-
             # Build the QA prompt
-            base_prompt = self.QA_PROMPTS.get(qa_context, self.QA_PROMPTS["slot_symbol"])
             full_prompt = (
-                f"{base_prompt}\n"
-                f"THEME: {theme}\n"
-                f"ADDITIONAL REQUIREMENTS: {requirements}\n\n"
-                f"For each criterion, respond with:\n"
-                f"- Grade: PASS / WARN / FAIL\n"
-                f"- Brief explanation (1 sentence)\n"
-                f"- Fix suggestion if WARN or FAIL\n\n"
-                f"End with an OVERALL VERDICT: PASS / PASS_WITH_WARNINGS / FAIL\n"
-                f"And a 1-sentence summary.\n\n"
+                f"{_qa_prompt_head(self.QA_PROMPTS, qa_context, theme, requirements)}"
                 f"Respond in JSON format with keys: criteria (list), overall_verdict, summary"
             )
 
@@ -147,7 +157,7 @@ class VisionQATool(BaseTool):
                     "role": "user",
                     "content": [
                         {"type": "text", "text": full_prompt},
-                        {"type": "image_url", "image_url": {"url": f"data:{mime};base64,{b64}", "detail": "high"}},
+                        _image_part(path),
                     ]
                 }],
                 max_tokens=1500,
@@ -176,6 +186,93 @@ class VisionQATool(BaseTool):
             return json.dumps({"error": str(e), "image_path": image_path, "status": "error"})
 
 
+class VisionQABatchInput(BaseModel):
+    image_paths: list[str] = Field(description="Paths of the images to analyze together (max 10)")
+    qa_context: str = Field(
+        default="slot_symbol",
+        description="QA context shared by all images: 'slot_symbol', 'background', 'mood_board', 'logo', 'ui_element'"
+    )
+    theme: str = Field(default="", description="Game theme for context, e.g. 'Ancient Egyptian'")
+    requirements: str = Field(default="", description="Specific requirements to check, e.g. 'must not appeal to minors'")
+
+
+class VisionQABatchTool(BaseTool):
+    """
+    Vision QA for a set of images of the same kind in ONE GPT-4o request:
+    all mood board variants, or all symbols. One round-trip and one copy
+    of the QA instructions instead of one per image; each image still
+    gets its own graded report. Same criteria as VisionQATool.
+    """
+
+    name: str = "vision_qa_batch"
+    description: str = (
+        "Analyze up to 10 generated images of the same kind (e.g. all mood boards, all symbols) in one "
+        "AI vision call. Same checks and PASS/WARN/FAIL grades as vision_qa, returned per image. "
+        "Use once after generating a set of images; use vision_qa to re-check a single regenerated image."
+    )
+    args_schema: type[BaseModel] = VisionQABatchInput
+
+    MAX_IMAGES: ClassVar[int] = 10
+
+    def _run(self, image_paths: list[str], qa_context: str = "slot_symbol", theme: str = "", requirements: str = "") -> str:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            return json.dumps({"error": "OPENAI_API_KEY not set", "status": "skipped"})
+
+        paths = [Path(p) for p in image_paths[:self.MAX_IMAGES]]
+        missing = [str(p) for p in paths if not p.exists()]
+        found = [p for p in paths if p.exists()]
+        if not found:
+            return json.dumps({"error": "No images found", "missing": missing, "status": "skipped"})
+
+        try:
+            from openai import OpenAI
+
+            client = OpenAI(api_key=api_key)
+
+            full_prompt = (
+                f"{_qa_prompt_head(VisionQATool.QA_PROMPTS, qa_context, theme, requirements)}"
+                f"You are given {len(found)} images, numbered 1 to {len(found)} in the order shown. "
+                f"Grade EACH image separately against the criteria above.\n"
+                f"Respond in JSON format with key 'results': a list with one object per image, in order, "
+                f"each with keys: image_index, criteria (list), overall_verdict, summary"
+            )
+            content = [{"type": "text", "text": full_prompt}]
+            for i, p in enumerate(found, 1):
+                content.append({"type": "text", "text": f"Image {i}: {p.name}"})
+                content.append(_image_part(p))
+
+            response = client.chat.completions.create(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": content}],
+                max_tokens=min(4096, 300 + 600 * len(found)),
+                temperature=0.2,
+                response_format={"type": "json_object"},
+            )
+
+            result_text = response.choices[0].message.content
+            try:
+                parsed = json.loads(result_text)
+                results = parsed.get("results", [])
+                for i, r in enumerate(results):
+                    idx = r.get("image_index", i + 1)
+                    if isinstance(idx, int) and 1 <= idx <= len(found):
+                        r["image_path"] = str(found[idx - 1])
+                    r["qa_context"] = qa_context
+                return json.dumps({"results": results, "missing": missing}, indent=2)
+            except (json.JSONDecodeError, AttributeError):
+                return json.dumps({
+                    "image_paths": [str(p) for p in found],
+                    "qa_context": qa_context,
+                    "raw_analysis": result_text,
+                    "missing": missing,
+                    "note": "Could not parse as JSON, returning raw analysis",
+                }, indent=2)
+
+        except Exception as e:
+            return json.dumps({"error": str(e), "image_paths": image_paths, "status": "error"})
+
+
 # ============================================================
 # UPGRADE 7: Paytable Optimizer — Iterative RTP Convergence
 # ============================================================
@@ -19,6 +19,8 @@ Usage (in pipeline code):
         files=["01_research/market_sweep.json"],
         auto=False,
     )
+
+Async pipelines call it from a worker thread (asyncio.to_thread).
 """
 
 import sqlite3
@@ -72,6 +74,7 @@ def web_hitl_checkpoint(
     files: list[str] = None,
     auto: bool = False,
     timeout: int = 3600,  # 1 hour max wait
+    max_poll_interval: float = 2.0,
 ) -> tuple[bool, str]:
     """
     Block the pipeline and wait for user review via the web UI.
@@ -86,6 +89,7 @@ def web_hitl_checkpoint(
         files: List of relative file paths the user should look at
         auto: If True, auto-approve without blocking
         timeout: Max seconds to wait for review (default 1 hour)
+        max_poll_interval: Polling backs off from 0.5s up to this many seconds
 
     Returns:
         (approved: bool, feedback: str)
@@ -93,61 +97,112 @@ def web_hitl_checkpoint(
     if auto:
         return True, ""
 
+    review_id = _create_review(job_id, stage, title, summary, files)
+
+    # Poll the DB until the review is resolved or timeout
+    backoff = _PollBackoff(review_id, timeout, max_poll_interval)
+    while True:
+        delay = backoff.next_delay()
+        if delay is None:
+            break
+        time.sleep(delay)
+
+        started = time.monotonic()
+        result = _poll_review(review_id)
+        backoff.polled(time.monotonic() - started)
+        if result is not None:
+            return result
+
+    return _expire_review(review_id, timeout)
+
+
+class _PollBackoff:
+    """
+    Poll schedule for a pending review: 0.5s, 1s, 2s ... up to the cap, so
+    a quick approval is picked up almost immediately while a long wait
+    settles into cheap polling. A slow DB round-trip raises the cap to keep
+    polling under ~5% of wall time. Prints a heartbeat every 30 polls.
+    """
+
+    HEARTBEAT_POLLS = 30
+
+    def __init__(self, review_id: str, timeout: float, max_interval: float):
+        self.review_id = review_id
+        self.interval = min(0.5, max_interval)
+        self.max_interval = max_interval
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout
+        self.polls = 0
+
+    def next_delay(self):
+        """Seconds to wait before the next poll, or None once timed out."""
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return min(self.interval, remaining)
+
+    def polled(self, rtt: float):
+        self.polls += 1
+        cap = max(self.max_interval, rtt * 20)
+        self.interval = min(self.interval * 2, cap)
+        if self.polls % self.HEARTBEAT_POLLS == 0:
+            waited = int(time.monotonic() - self.started)
+            print(f"[HITL] Still waiting for review {self.review_id} ({waited}s)")
+
+
+def _create_review(job_id: str, stage: str, title: str, summary: str, files: list[str] = None) -> str:
+    """Insert the pending review and flag the job as waiting. Returns the review ID."""
     import uuid
     import json
 
     review_id = f"rev_{uuid.uuid4().hex[:8]}"
 
-    # Create the review record
+    # Create the review record and mark the job as waiting in one
+    # transaction — one commit (and fsync) per checkpoint
     db = _get_db()
-    db.execute(
-        "INSERT INTO reviews (id, job_id, stage, title, summary, files, status) "
-        "VALUES (?,?,?,?,?,?,?)",
-        (review_id, job_id, stage, title, summary, json.dumps(files or []), "pending")
-    )
-    db.commit()
+    with db:
+        db.execute(
+            "INSERT INTO reviews (id, job_id, stage, title, summary, files, status) "
+            "VALUES (?,?,?,?,?,?,?)",
+            (review_id, job_id, stage, title, summary, json.dumps(files or []), "pending")
+        )
+        db.execute(
+            "UPDATE jobs SET current_stage=? WHERE id=?",
+            (f"⏸ Waiting for review: {title}", job_id)
+        )
     db.close()
 
-    # Update the job's current_stage to indicate it's waiting for review
+    print(f"[HITL] Pipeline paused at '{stage}' -- waiting for review: {review_id}")
+    return review_id
+
+
+def _poll_review(review_id: str):
+    """Return (approved, feedback) once the review is resolved, else None."""
     db = _get_db()
-    db.execute(
-        "UPDATE jobs SET current_stage=? WHERE id=?",
-        (f"\u23f8 Waiting for review: {title}", job_id)
-    )
-    db.commit()
+    row = db.execute(
+        "SELECT status, approved, feedback FROM reviews WHERE id=?",
+        (review_id,)
+    ).fetchone()
     db.close()
 
-    print(f"[HITL] Pipeline paused at '{stage}' -- waiting for review: {review_id}")
+    if not row or row["status"] == "pending":
+        return None
+    approved = bool(row["approved"])
+    feedback = row["feedback"] or ""
+    print(f"[HITL] Review {review_id}: {'APPROVED' if approved else 'REJECTED'} -- {feedback}")
+    return approved, feedback
 
-    # Poll the DB until the review is resolved or timeout
-    poll_interval = 3  # seconds
-    elapsed = 0
-    while elapsed < timeout:
-        time.sleep(poll_interval)
-        elapsed += poll_interval
-
-        db = _get_db()
-        row = db.execute(
-            "SELECT status, approved, feedback FROM reviews WHERE id=?",
-            (review_id,)
-        ).fetchone()
-        db.close()
-
-        if row and row["status"] != "pending":
-            approved = bool(row["approved"])
-            feedback = row["feedback"] or ""
-            print(f"[HITL] Review {review_id}: {'APPROVED' if approved else 'REJECTED'} -- {feedback}")
-            return approved, feedback
 
-    # Timeout -- auto-approve
+def _expire_review(review_id: str, timeout: int) -> tuple[bool, str]:
+    """Timeout -- auto-approve."""
     print(f"[HITL] Review {review_id}: TIMEOUT after {timeout}s -- auto-approving")
     db = _get_db()
-    db.execute(
-        "UPDATE reviews SET status='approved', approved=1, "
-        "feedback='Auto-approved (timeout)', resolved_at=datetime('now') WHERE id=?",
-        (review_id,)
-    )
-    db.commit()
+    with db:
+        db.execute(
+            "UPDATE reviews SET status='approved', approved=1, "
+            "feedback='Auto-approved (timeout)', resolved_at=datetime('now') WHERE id=?",
+            (review_id,)
+        )
     db.close()
     return True, "Auto-approved (timeout)"
 
@@ -2,7 +2,7 @@
 ARKAINBRAIN — AI-Powered Gaming Intelligence Platform
 by ArkainGames.com
 """
-import json, os, secrets, sqlite3, subprocess, time, uuid
+import json, os, secrets, sqlite3, stat, subprocess, time, uuid
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
@@ -394,6 +394,25 @@ def history_page():
     return layout(f'<h2 style="font-size:20px;font-weight:800;color:var(--text-bright);margin-bottom:24px">{ICON_CLOCK} Pipeline History</h2><div class="card" style="padding:0;overflow:hidden">{rows}</div>', "history")
 
 # ─── FILES ───
+def _tree_stats(root):
+    """(file count, total bytes) for a directory tree in one walk.
+    os.fwalk (Linux/POSIX) stats each name relative to its directory's fd, so
+    no full path is rebuilt and resolved per file; os.walk elsewhere."""
+    count = size = 0
+    if hasattr(os, "fwalk"):
+        for _, _, names, dfd in os.fwalk(root):
+            for name in names:
+                try: st = os.stat(name, dir_fd=dfd)
+                except OSError: continue
+                if stat.S_ISREG(st.st_mode): count += 1; size += st.st_size
+    else:
+        for dirpath, _, names in os.walk(root):
+            for name in names:
+                try: size += os.path.getsize(os.path.join(dirpath, name))
+                except OSError: continue
+                count += 1
+    return count, size
+
 @app.route("/files")
 @login_required
 def files_page():
@@ -401,8 +420,7 @@ def files_page():
     if OUTPUT_DIR.exists():
         for d in sorted(OUTPUT_DIR.iterdir(), reverse=True):
             if d.is_dir():
-                fc = sum(1 for _ in d.rglob("*") if _.is_file())
-                ts = sum(f.stat().st_size for f in d.rglob("*") if f.is_file())
+                fc, ts = _tree_stats(d)
                 dirs.append({"name":d.name,"files":fc,"size":f"{ts/1024:.0f} KB" if ts<1048576 else f"{ts/1048576:.1f} MB","mtime":datetime.fromtimestamp(d.stat().st_mtime).strftime("%Y-%m-%d %H:%M")})
     rows = "".join(f'<div class="file-row"><a href="/files/{d["name"]}">{ICON_FOLDER} {d["name"]}</a><span class="file-size">{d["files"]} files &middot; {d["size"]}</span></div>' for d in dirs)
     if not rows: rows = '<div class="empty-state"><h3>No output files yet</h3></div>'
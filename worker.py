@@ -198,7 +198,8 @@ def run_pipeline(job_id: str, params_json: str):
                     update_db(job_id, current_stage=f"State Recon: {state}")
                     logger.log(f"Running recon for {state}")
                     from flows.state_recon import run_recon
-                    run_recon(state, auto=True, job_id=job_id)
+                    # The game pipeline below queries this state's regs from Qdrant
+                    run_recon(state, auto=True, job_id=job_id, wait_ingest=True)
                     logger.log(f"Recon complete for {state}")
                 except Exception as e:
                     logger.log(f"WARN: State recon failed for {state}: {e}")